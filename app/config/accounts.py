@@ -0,0 +1,87 @@
+import json
+import re
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+from config.settings import Settings
+
+
+class Account:
+    """
+    One Naukri login and where its per-account state lives.
+
+    The default account comes from the environment and keeps the original
+    single-account file locations; fleet accounts get their own cookie,
+    resume and checkpoint files under FLEET_STATE_DIR.
+    """
+
+    def __init__(self, key, email, password, profile_url, resume_url,
+                 cookie_file=None, resume_path=None, checkpoint_file=None):
+        self.key = key
+        self.email = email
+        self.password = password
+        self.profile_url = profile_url
+        self.resume_url = resume_url
+        # None means the session manager's default cookie file
+        self.cookie_file = cookie_file
+        self.resume_path = resume_path or Settings.RESUME_TEMP_PATH
+        self.checkpoint_file = checkpoint_file if checkpoint_file is not None else Settings.CHECKPOINT_FILE
+
+    @classmethod
+    def from_settings(cls):
+        return cls(
+            key=Settings.NAUKRI_EMAIL,
+            email=Settings.NAUKRI_EMAIL,
+            password=Settings.NAUKRI_PASSWORD,
+            profile_url=Settings.NAUKRI_PROFILE_URL,
+            resume_url=Settings.GITHUB_RESUME_URL,
+        )
+
+    @classmethod
+    def for_fleet(cls, entry):
+        key = entry.get("name") or entry["email"]
+        slug = re.sub(r"[^a-z0-9]+", "_", key.lower()).strip("_")
+        state_dir = Path(Settings.FLEET_STATE_DIR)
+        resume_url = entry.get("resume_url", Settings.GITHUB_RESUME_URL)
+        return cls(
+            key=key,
+            email=entry["email"],
+            password=entry["password"],
+            profile_url=entry.get("profile_url", Settings.NAUKRI_PROFILE_URL),
+            resume_url=resume_url,
+            cookie_file=str(state_dir / "cookies" / f"{slug}.json"),
+            resume_path=str(state_dir / "resumes" / slug / _resume_name(entry, resume_url, slug)),
+            checkpoint_file=str(state_dir / "checkpoints" / f"{slug}.json"),
+        )
+
+
+def _resume_name(entry, resume_url, slug):
+    """
+    The file name the account's resume is uploaded as, which is what its
+    profile shows: resume_name from the entry, else the PDF name in the
+    resume URL, else one derived from the account.
+    """
+    if entry.get("resume_name"):
+        return Path(entry["resume_name"]).name
+    url_name = Path(unquote(urlparse(resume_url or "").path)).name
+    if url_name.lower().endswith(".pdf"):
+        return url_name
+    return f"{slug}_resume.pdf"
+
+
+def load_accounts(path=None):
+    """
+    Read the fleet accounts file: a JSON list of objects with email and
+    password, and optionally name, profile_url, resume_url and resume_name.
+    """
+    path = Path(path or Settings.FLEET_ACCOUNTS_FILE)
+    with open(path, "r") as f:
+        entries = json.load(f)
+
+    accounts = {}
+    for entry in entries:
+        account = Account.for_fleet(entry)
+        if account.key in accounts:
+            raise ValueError(f"❌ Duplicate account in {path}: {account.key}")
+        accounts[account.key] = account
+    return accounts
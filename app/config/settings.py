@@ -59,3 +59,66 @@ class Settings:
     WAIT_TIME: int = get_int_env("WAIT_TIME", 15)
     HEADLESS: bool = get_bool_env("HEADLESS", False)
 
+    # Network-level upload confirmation (selenium-wire)
+    NETWORK_UPLOAD_CONFIRM: bool = get_bool_env("NETWORK_UPLOAD_CONFIRM", False)
+    SELENIUM_WIRE_HOST: str = get_optional_env("SELENIUM_WIRE_HOST", "app")
+    SELENIUM_WIRE_PORT: int = get_int_env("SELENIUM_WIRE_PORT", 8087)
+    UPLOAD_REQUEST_PATTERN: str = get_optional_env(
+        "UPLOAD_REQUEST_PATTERN", r".*naukri\.com/.*(resume|attach|upload).*"
+    )
+    UPLOAD_CONFIRM_TIMEOUT: int = get_int_env("UPLOAD_CONFIRM_TIMEOUT", 30)
+
+    # Pre-upload resume optimisation
+    OPTIMIZE_RESUME: bool = get_bool_env("OPTIMIZE_RESUME", False)
+    STRIP_PDF_METADATA: bool = get_bool_env("STRIP_PDF_METADATA", False)
+    # Under logs/ so the cache survives container restarts with the mounted volume
+    RESUME_CACHE_DIR: str = get_optional_env("RESUME_CACHE_DIR", "logs/resume_cache")
+
+    # Skip the upload when the profile already shows this resume uploaded today.
+    # Disable when the file changes under the same name (the workflow does on push).
+    SKIP_UPLOAD_IF_CURRENT: bool = get_bool_env("SKIP_UPLOAD_IF_CURRENT", True)
+
+    # Adaptive wait timeouts learned from previous runs' wait durations
+    ADAPTIVE_TIMEOUTS: bool = get_bool_env("ADAPTIVE_TIMEOUTS", True)
+    WAIT_TIMINGS_FILE: str = get_optional_env("WAIT_TIMINGS_FILE", "logs/wait_timings.json")
+    ADAPTIVE_TIMEOUT_PERCENTILE: int = get_int_env("ADAPTIVE_TIMEOUT_PERCENTILE", 95)
+    ADAPTIVE_TIMEOUT_MARGIN_PCT: int = get_int_env("ADAPTIVE_TIMEOUT_MARGIN_PCT", 150)
+    ADAPTIVE_TIMEOUT_FLOOR: int = get_int_env("ADAPTIVE_TIMEOUT_FLOOR", 1)
+    ADAPTIVE_MIN_SAMPLES: int = get_int_env("ADAPTIVE_MIN_SAMPLES", 5)
+
+    # Checkpointed flow / retries
+    CHECKPOINT_FILE: str = get_optional_env("CHECKPOINT_FILE", "logs/run_checkpoint.json")
+    RUN_ATTEMPTS: int = get_int_env("RUN_ATTEMPTS", 2)
+
+    # Browser backend: "grid" (Selenium Grid), "local" (in-container chromedriver)
+    # or "cdp" (local Chromium over DevTools)
+    DRIVER_MODE: str = get_optional_env("DRIVER_MODE", "grid")
+    SELENIUM_URL: str = get_optional_env("SELENIUM_URL", "http://selenium:4444/wd/hub")
+    CHROME_BINARY: str = get_optional_env("CHROME_BINARY", "chromium")
+    CHROMEDRIVER_PATH: str = get_optional_env("CHROMEDRIVER_PATH", "chromedriver")
+
+    # Driver command profiling
+    PROFILE_COMMANDS: bool = get_bool_env("PROFILE_COMMANDS", False)
+    PROFILE_TOP_N: int = get_int_env("PROFILE_TOP_N", 15)
+
+    # WebDriver session recording for offline replay (app/tools/replay_benchmark.py)
+    RECORD_SESSION_DIR: str = get_optional_env("RECORD_SESSION_DIR", "")
+
+    # Persistent Chrome profile (HTTP cache, local storage, service workers)
+    CHROME_PROFILE_DIR: str = get_optional_env("CHROME_PROFILE_DIR", "")
+    CHROME_PROFILE_MAX_MB: int = get_int_env("CHROME_PROFILE_MAX_MB", 200)
+
+    # Fleet: queue-driven runs over many accounts (app/fleet.py)
+    FLEET_ACCOUNTS_FILE: str = get_optional_env("FLEET_ACCOUNTS_FILE", "accounts.json")
+    FLEET_QUEUE_DB: str = get_optional_env("FLEET_QUEUE_DB", "logs/fleet_queue.db")
+    FLEET_STATE_DIR: str = get_optional_env("FLEET_STATE_DIR", "fleet_state")
+    # Comma-separated Grid endpoints, one shard each; defaults to SELENIUM_URL
+    GRID_URLS: str = get_optional_env("GRID_URLS", "")
+    FLEET_WORKERS_PER_SHARD: int = get_int_env("FLEET_WORKERS_PER_SHARD", 1)
+    FLEET_MAX_ATTEMPTS: int = get_int_env("FLEET_MAX_ATTEMPTS", 3)
+    FLEET_RETRY_DELAY: int = get_int_env("FLEET_RETRY_DELAY", 60)
+    FLEET_STALE_JOB_SECONDS: int = get_int_env("FLEET_STALE_JOB_SECONDS", 900)
+    FLEET_HOST_RATE_PER_MIN: int = get_int_env("FLEET_HOST_RATE_PER_MIN", 6)
+    FLEET_HOST_BURST: int = get_int_env("FLEET_HOST_BURST", 2)
+    FLEET_ACCOUNT_RATE_PER_HOUR: int = get_int_env("FLEET_ACCOUNT_RATE_PER_HOUR", 2)
+    FLEET_REPORT_INTERVAL: int = get_int_env("FLEET_REPORT_INTERVAL", 30)
@@ -0,0 +1,521 @@
+import base64
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+import uuid
+
+import requests
+import websocket
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+
+from config.settings import Settings
+from core.logger import logger
+
+
+# Locator strategies translated to CSS; XPath is evaluated natively
+CSS_LOCATORS = {
+    By.ID: lambda v: f'[id="{v}"]',
+    By.NAME: lambda v: f'[name="{v}"]',
+    By.CLASS_NAME: lambda v: f".{v}",
+    By.TAG_NAME: lambda v: v,
+    By.CSS_SELECTOR: lambda v: v,
+}
+
+FIND_JS = r"""
+function(using, value, root, firstOnly){
+    root = root || document;
+    var doc = root.ownerDocument || root;
+    if(using === 'xpath'){
+        if(firstOnly){
+            return doc.evaluate(value, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        }
+        var snapshot = doc.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var out = [];
+        for(var i = 0; i < snapshot.snapshotLength; i++) out.push(snapshot.snapshotItem(i));
+        return out;
+    }
+    return firstOnly ? root.querySelector(value) : Array.prototype.slice.call(root.querySelectorAll(value));
+}
+"""
+
+
+def _expand_prefs(prefs):
+    """Turn Selenium's dotted pref keys into the nested Preferences file layout."""
+    nested = {}
+    for key, value in prefs.items():
+        node = nested
+        parts = key.split(".")
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+        node[parts[-1]] = value
+    return nested
+
+
+def _merge_prefs(base, updates):
+    for key, value in updates.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            _merge_prefs(base[key], value)
+        else:
+            base[key] = value
+    return base
+
+
+class CdpElement:
+    """A DOM node held as a DevTools remote object."""
+
+    def __init__(self, driver, object_id, context_id=None):
+        self._driver = driver
+        self.object_id = object_id
+        self.context_id = context_id
+
+    def _call(self, function_declaration, *args):
+        return self._driver._call_function(function_declaration, (self,) + args)
+
+    @property
+    def tag_name(self):
+        return self._call("function(el){ return el.tagName.toLowerCase(); }")
+
+    @property
+    def text(self):
+        return self._call("function(el){ return el.innerText || el.textContent || ''; }")
+
+    def get_attribute(self, name):
+        return self._call(
+            """function(el, name){
+                var value = el[name];
+                if(value === undefined || value === null || typeof value === 'object' || typeof value === 'function'){
+                    value = el.getAttribute(name);
+                }
+                return value === null || value === undefined ? null : String(value);
+            }""",
+            name,
+        )
+
+    def is_displayed(self):
+        return self._call(
+            """function(el){
+                var style = window.getComputedStyle(el);
+                if(style.visibility === 'hidden' || style.display === 'none') return false;
+                var rect = el.getBoundingClientRect();
+                return rect.width > 0 && rect.height > 0;
+            }"""
+        )
+
+    def is_enabled(self):
+        return self._call("function(el){ return !el.disabled; }")
+
+    def click(self):
+        # Scroll into view and resolve the centre point in top-level viewport coordinates
+        point = self._call(
+            """function(el){
+                el.scrollIntoView({block: 'center', inline: 'center'});
+                var rect = el.getBoundingClientRect();
+                var x = rect.left + rect.width / 2, y = rect.top + rect.height / 2;
+                var win = el.ownerDocument.defaultView;
+                while(win && win.frameElement){
+                    var frameRect = win.frameElement.getBoundingClientRect();
+                    x += frameRect.left; y += frameRect.top;
+                    win = win.parent;
+                }
+                return [x, y];
+            }"""
+        )
+        x, y = point
+        for event_type in ("mouseMoved", "mousePressed", "mouseReleased"):
+            self._driver.execute("Input.dispatchMouseEvent", {
+                "type": event_type, "x": x, "y": y, "button": "left", "clickCount": 1,
+            })
+
+    def clear(self):
+        self._call(
+            """function(el){
+                el.value = '';
+                el.dispatchEvent(new Event('input', {bubbles: true}));
+                el.dispatchEvent(new Event('change', {bubbles: true}));
+            }"""
+        )
+
+    def send_keys(self, *value):
+        text = "".join(map(str, value))
+        if self.get_attribute("type") == "file":
+            files = [os.path.abspath(path) for path in text.split("\n")]
+            self._driver.execute("DOM.setFileInputFiles", {"files": files, "objectId": self.object_id})
+            return
+
+        self._call("function(el){ el.focus(); }")
+        self._driver.execute("Input.insertText", {"text": text})
+
+    def find_element(self, by=By.ID, value=None):
+        return self._driver._find(by, value, root=self, first_only=True)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self._driver._find(by, value, root=self, first_only=False)
+
+
+class CdpSwitchTo:
+    """Frame switching for CdpDriver, mirroring driver.switch_to in Selenium."""
+
+    def __init__(self, driver):
+        self._driver = driver
+
+    def frame(self, frame_reference):
+        if isinstance(frame_reference, int):
+            frame_reference = self._driver.execute_script(
+                "return window.frames[arguments[0]].frameElement;", frame_reference
+            )
+        elif isinstance(frame_reference, str):
+            frame_reference = self._driver.find_element(
+                By.CSS_SELECTOR, f'iframe[name="{frame_reference}"], iframe[id="{frame_reference}"]'
+            )
+        self._driver._enter_frame(frame_reference)
+
+    def default_content(self):
+        self._driver._context_id = None
+
+    def parent_frame(self):
+        # Isolated worlds do not expose the parent's context; fall back to the top document
+        self._driver._context_id = None
+
+
+class CdpDriver:
+    """
+    Drives a local headless Chromium directly over the DevTools websocket.
+
+    Implements the part of the Selenium WebDriver API that UpdateResumeFlow
+    and the utils rely on, so the flow runs unchanged, without the Selenium
+    Grid hop: every command is one local websocket message instead of an
+    HTTP request that the Grid relays to chromedriver.
+
+    That surface is session_id, current_url, get, find_element(s) (raising
+    Selenium's NoSuchElementException so WebDriverWait works),
+    execute_script, get_cookies/add_cookie, save_screenshot, switch_to
+    frames, implicitly_wait, set_page_load_timeout and quit; elements
+    (CdpElement) provide text, click, clear, send_keys, get_attribute,
+    is_displayed and is_enabled. Anything else used from workflows/ or
+    utils/ needs a fallback for this driver.
+    """
+
+    _is_remote = False
+
+    def __init__(self, process, websocket_url, user_data_dir, owns_user_data_dir=True):
+        self.session_id = uuid.uuid4().hex
+        self._process = process
+        self._user_data_dir = user_data_dir
+        self._owns_user_data_dir = owns_user_data_dir
+        self._ws = websocket.create_connection(websocket_url, timeout=60, suppress_origin=True)
+        self._next_id = 0
+        self._context_id = None
+        self._implicit_wait = 0
+        self._page_load_timeout = 60
+        self._switch_to = CdpSwitchTo(self)
+
+        self.execute("Page.enable")
+
+    # ------------------------------------------------------------
+    # LAUNCH
+    # ------------------------------------------------------------
+
+    @classmethod
+    def launch(cls, options, user_data_dir=None):
+        """Start Chromium with the given Selenium Options and attach to its first tab."""
+        owns_user_data_dir = user_data_dir is None
+        if owns_user_data_dir:
+            user_data_dir = tempfile.mkdtemp(prefix="cdp-profile-")
+
+        # Experimental prefs are merged straight into the profile's Preferences
+        prefs = options.experimental_options.get("prefs")
+        if prefs:
+            prefs_dir = os.path.join(user_data_dir, "Default")
+            prefs_file = os.path.join(prefs_dir, "Preferences")
+            os.makedirs(prefs_dir, exist_ok=True)
+            existing = {}
+            if os.path.exists(prefs_file):
+                try:
+                    with open(prefs_file) as f:
+                        existing = json.load(f)
+                except (OSError, ValueError):
+                    existing = {}
+            with open(prefs_file, "w") as f:
+                json.dump(_merge_prefs(existing, _expand_prefs(prefs)), f)
+
+        active_port_file = os.path.join(user_data_dir, "DevToolsActivePort")
+        if os.path.exists(active_port_file):
+            os.remove(active_port_file)
+
+        command = [
+            Settings.CHROME_BINARY,
+            "--remote-debugging-port=0",
+            f"--user-data-dir={user_data_dir}",
+            *options.arguments,
+            "about:blank",
+        ]
+        logger.info(f"Launching Chromium for direct CDP control: {Settings.CHROME_BINARY}")
+        process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        # Chromium writes the chosen port to DevToolsActivePort once it is listening
+        start = time.time()
+        while time.time() - start < 30:
+            if process.poll() is not None:
+                raise WebDriverException(f"Chromium exited during startup (code {process.returncode})")
+            try:
+                with open(active_port_file) as f:
+                    port = int(f.readline().strip())
+                targets = requests.get(f"http://127.0.0.1:{port}/json/list", timeout=5).json()
+                pages = [t for t in targets if t.get("type") == "page"]
+                if pages:
+                    logger.info(f"✓ Chromium DevTools listening on port {port}")
+                    return cls(process, pages[0]["webSocketDebuggerUrl"], user_data_dir, owns_user_data_dir)
+            except (OSError, ValueError, requests.RequestException):
+                pass
+            time.sleep(0.2)
+
+        process.kill()
+        raise WebDriverException("❌ Chromium DevTools endpoint did not become available in time")
+
+    # ------------------------------------------------------------
+    # PROTOCOL
+    # ------------------------------------------------------------
+
+    def execute(self, method, params=None):
+        """Send one DevTools command and return its result, skipping unrelated events."""
+        self._next_id += 1
+        message_id = self._next_id
+        self._ws.send(json.dumps({"id": message_id, "method": method, "params": params or {}}))
+
+        while True:
+            message = json.loads(self._ws.recv())
+            if message.get("id") != message_id:
+                continue
+            if "error" in message:
+                error = message["error"].get("message", str(message["error"]))
+                if "Could not find object with given id" in error or "No node with given id" in error:
+                    raise StaleElementReferenceException(error)
+                raise WebDriverException(f"{method} failed: {error}")
+            return message.get("result", {})
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        return self.execute(cmd, cmd_args)
+
+    def _to_call_argument(self, value):
+        if isinstance(value, CdpElement):
+            return {"objectId": value.object_id}
+        return {"value": value}
+
+    def _from_remote(self, remote, context_id):
+        """Convert a Runtime.RemoteObject into Python values and CdpElements."""
+        if remote.get("subtype") == "node":
+            return CdpElement(self, remote["objectId"], context_id)
+        if remote.get("subtype") == "null" or remote.get("type") == "undefined":
+            return None
+        if "objectId" not in remote:
+            return remote.get("value")
+        if remote.get("type") == "function":
+            return None
+
+        properties = self.execute("Runtime.getProperties", {
+            "objectId": remote["objectId"], "ownProperties": True,
+        })["result"]
+        if remote.get("subtype") == "array":
+            items = [p for p in properties if p["name"].isdigit() and "value" in p]
+            items.sort(key=lambda p: int(p["name"]))
+            return [self._from_remote(p["value"], context_id) for p in items]
+        return {
+            p["name"]: self._from_remote(p["value"], context_id)
+            for p in properties
+            if "value" in p and p.get("enumerable", True)
+        }
+
+    def _call_function(self, function_declaration, args):
+        """
+        Call a JS function with Selenium-style arguments in the current frame.
+
+        When an element is passed, the call runs in that element's context so
+        frame scoping always matches where the element was found.
+        """
+        args = list(args)
+        element_args = [a for a in args if isinstance(a, CdpElement)]
+
+        if element_args:
+            context_id = element_args[0].context_id
+            result = self.execute("Runtime.callFunctionOn", {
+                "functionDeclaration": function_declaration,
+                "objectId": element_args[0].object_id,
+                "arguments": [self._to_call_argument(a) for a in args],
+                "awaitPromise": True,
+            })
+        else:
+            context_id = self._context_id
+            params = {
+                "expression": f"({function_declaration}).apply(null, {json.dumps(args)})",
+                "awaitPromise": True,
+            }
+            if context_id:
+                params["contextId"] = context_id
+            result = self.execute("Runtime.evaluate", params)
+
+        if "exceptionDetails" in result:
+            details = result["exceptionDetails"]
+            description = details.get("exception", {}).get("description") or details.get("text")
+            raise JavascriptException(description)
+
+        return self._from_remote(result["result"], context_id)
+
+    def _enter_frame(self, frame_element):
+        node = self.execute("DOM.describeNode", {"objectId": frame_element.object_id})["node"]
+        frame_id = node.get("frameId")
+        if not frame_id:
+            raise WebDriverException("Element is not a frame")
+        world = self.execute("Page.createIsolatedWorld", {
+            "frameId": frame_id, "worldName": "naukri_automation", "grantUniveralAccess": True,
+        })
+        self._context_id = world["executionContextId"]
+
+    def _find(self, by, value, root=None, first_only=True):
+        if by == By.XPATH:
+            using, query = "xpath", value
+        elif by in CSS_LOCATORS:
+            using, query = "css", CSS_LOCATORS[by](value)
+        else:
+            raise WebDriverException(f"Locator strategy not supported by the CDP backend: {by}")
+
+        # Honour the implicit wait like chromedriver does
+        deadline = time.time() + self._implicit_wait
+        while True:
+            found = self._call_function(FIND_JS, (using, query, root, first_only))
+            if found:
+                return found
+            if time.time() >= deadline:
+                if first_only:
+                    raise NoSuchElementException(f"Unable to locate element: {by}={value}")
+                return []
+            time.sleep(0.1)
+
+    # ------------------------------------------------------------
+    # BROWSER DRIVER INTERFACE
+    # ------------------------------------------------------------
+
+    @property
+    def switch_to(self):
+        return self._switch_to
+
+    @property
+    def current_url(self):
+        return self.execute("Runtime.evaluate", {"expression": "location.href", "returnByValue": True})["result"]["value"]
+
+    @property
+    def title(self):
+        return self.execute("Runtime.evaluate", {"expression": "document.title", "returnByValue": True})["result"]["value"]
+
+    def implicitly_wait(self, time_to_wait):
+        self._implicit_wait = time_to_wait
+
+    def set_page_load_timeout(self, time_to_wait):
+        self._page_load_timeout = time_to_wait
+
+    def get(self, url):
+        self._context_id = None
+        result = self.execute("Page.navigate", {"url": url})
+        if result.get("errorText"):
+            raise WebDriverException(f"Navigation to {url} failed: {result['errorText']}")
+
+        deadline = time.time() + self._page_load_timeout
+        while time.time() < deadline:
+            try:
+                state = self.execute("Runtime.evaluate", {
+                    "expression": "document.readyState", "returnByValue": True,
+                })["result"].get("value")
+                if state == "complete":
+                    return
+            except WebDriverException:
+                # The execution context is replaced mid-navigation
+                pass
+            time.sleep(0.1)
+        raise TimeoutException(f"Page load timed out after {self._page_load_timeout}s: {url}")
+
+    def find_element(self, by=By.ID, value=None):
+        return self._find(by, value, first_only=True)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self._find(by, value, first_only=False)
+
+    def execute_script(self, script, *args):
+        return self._call_function(f"function(){{ {script}\n}}", args)
+
+    def get_cookies(self):
+        cookies = []
+        for c in self.execute("Network.getCookies")["cookies"]:
+            cookie = {
+                "name": c["name"],
+                "value": c["value"],
+                "domain": c["domain"],
+                "path": c["path"],
+                "secure": c["secure"],
+                "httpOnly": c["httpOnly"],
+            }
+            if not c.get("session") and c.get("expires", -1) > 0:
+                cookie["expiry"] = int(c["expires"])
+            if c.get("sameSite"):
+                cookie["sameSite"] = c["sameSite"]
+            cookies.append(cookie)
+        return cookies
+
+    def add_cookie(self, cookie_dict):
+        params = {
+            "name": cookie_dict["name"],
+            "value": cookie_dict["value"],
+            "path": cookie_dict.get("path", "/"),
+            "secure": cookie_dict.get("secure", False),
+            "httpOnly": cookie_dict.get("httpOnly", False),
+        }
+        if cookie_dict.get("domain"):
+            params["domain"] = cookie_dict["domain"]
+        else:
+            params["url"] = self.current_url
+        if "expiry" in cookie_dict:
+            params["expires"] = cookie_dict["expiry"]
+        if cookie_dict.get("sameSite"):
+            params["sameSite"] = cookie_dict["sameSite"]
+
+        if not self.execute("Network.setCookie", params).get("success", True):
+            raise WebDriverException(f"Could not set cookie {cookie_dict['name']}")
+
+    def delete_all_cookies(self):
+        self.execute("Network.clearBrowserCookies")
+
+    def get_screenshot_as_png(self):
+        return base64.b64decode(self.execute("Page.captureScreenshot", {"format": "png"})["data"])
+
+    def save_screenshot(self, filename):
+        try:
+            with open(filename, "wb") as f:
+                f.write(self.get_screenshot_as_png())
+        except OSError:
+            return False
+        return True
+
+    def quit(self):
+        try:
+            self._ws.close()
+        except Exception:
+            pass
+
+        if self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+
+        if self._owns_user_data_dir:
+            shutil.rmtree(self._user_data_dir, ignore_errors=True)
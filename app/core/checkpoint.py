@@ -0,0 +1,102 @@
+import json
+import os
+import time
+from datetime import date
+from pathlib import Path
+
+from core.logger import logger
+
+
+class RetryPolicy:
+    """How often, and how patiently, a single flow step is retried."""
+
+    def __init__(self, attempts=2, delay=2.0, backoff=2.0):
+        self.attempts = attempts
+        self.delay = delay
+        self.backoff = backoff
+
+
+class NonRetryableError(Exception):
+    """A step failure that running the same step again cannot fix."""
+
+
+def run_with_retry(name, func, policy, on_retry=None):
+    """
+    Call func() until it succeeds or the policy's attempts are used up.
+
+    on_retry, if given, runs before every retry to restore whatever
+    precondition the step relies on (e.g. reloading the profile page).
+    NonRetryableError is raised at once, leaving recovery to the caller.
+    """
+    delay = policy.delay
+    for attempt in range(1, policy.attempts + 1):
+        try:
+            if attempt > 1 and on_retry:
+                on_retry()
+            return func()
+        except NonRetryableError as e:
+            logger.error(f"Step '{name}' failed, not retrying: {e}")
+            raise
+        except Exception as e:
+            if attempt == policy.attempts:
+                logger.error(f"Step '{name}' failed after {attempt} attempt(s): {e}")
+                raise
+            logger.warning(f"Step '{name}' failed (attempt {attempt}/{policy.attempts}): {e}")
+            logger.info(f"Retrying step '{name}' in {delay:.0f} seconds...")
+            time.sleep(delay)
+            delay *= policy.backoff
+
+
+class Checkpoint:
+    """
+    Results of completed flow steps, persisted to a JSON file.
+
+    Checkpoints are scoped to the current day so a new day's run always
+    starts cold. An empty path keeps checkpoints in memory only, which
+    still lets retries within the same process skip finished steps.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path) if path else None
+        self.steps = {}
+        self._load()
+
+    def _load(self):
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            if data.get("date") == date.today().isoformat():
+                self.steps = data.get("steps", {})
+                if self.steps:
+                    logger.info(f"Loaded checkpoint with steps: {', '.join(self.steps)}")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable checkpoint {self.path}: {e}")
+
+    def _save(self):
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump({"date": date.today().isoformat(), "steps": self.steps}, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Could not save checkpoint: {e}")
+
+    def get(self, name):
+        return self.steps.get(name)
+
+    def mark(self, name, result):
+        self.steps[name] = result
+        self._save()
+
+    def discard(self, name):
+        if self.steps.pop(name, None) is not None:
+            self._save()
+
+    def clear(self):
+        self.steps = {}
+        self._save()
@@ -0,0 +1,162 @@
+import fcntl
+import os
+import socket
+from pathlib import Path
+
+from core.logger import logger
+
+LOCK_FILE_NAME = ".automation.lock"
+
+# Chrome's own single-instance markers. SingletonLock is a symlink to
+# "<hostname>-<pid>" of the browser that owns the profile; after a crash they
+# stay behind and make the next Chrome refuse the profile.
+CHROME_SINGLETON_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie")
+
+# Regenerable caches, pruned oldest-first when the profile exceeds its cap.
+# Cookies, local storage and preferences are never touched.
+PRUNABLE_DIRS = (
+    "Default/Cache",
+    "Default/Code Cache",
+    "Default/Service Worker/CacheStorage",
+    "Default/Service Worker/ScriptCache",
+    "Default/GPUCache",
+    "GrShaderCache",
+    "ShaderCache",
+)
+
+
+def _dir_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+class ChromeProfile:
+    """
+    A persistent Chrome user-data-dir reused across runs.
+
+    Keeps the HTTP cache, local storage and service workers warm between
+    runs. An flock on a file inside the profile guarantees only one run
+    uses it at a time; the kernel drops the lock if the process crashes, so
+    a dead run never blocks the next one.
+
+    The browser can outlive the run that started it (an orphaned Chrome, or
+    a Grid session kept until the node's session timeout), so Chrome's own
+    Singleton files are only cleared once the pid they name is known to be
+    dead on this host, or, for a browser on a Grid node, once the Grid
+    reports no live sessions.
+    """
+
+    def __init__(self, path, max_mb):
+        self.path = Path(path)
+        self.max_bytes = max_mb * 1024 * 1024
+        self._lock_fd = None
+
+    def acquire(self, remote_idle=None) -> bool:
+        """
+        Lock the profile and prune it. Returns False if another run holds
+        it, or a browser may still have it open. When the browser runs
+        elsewhere (a Grid node), pass remote_idle: a callable that returns
+        True only if no browser there can still be using the profile.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path / LOCK_FILE_NAME, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._lock_fd = fd
+
+        if self._has_singletons():
+            owner = self._singleton_owner()
+            stale = remote_idle() if remote_idle else self._owner_is_dead(owner)
+            if not stale:
+                logger.warning(f"Chrome profile {self.path} may still be open in a browser ({owner or 'unknown owner'})")
+                self.release()
+                return False
+            logger.info(f"Clearing stale Chrome singleton files left by {owner or 'a crashed browser'}")
+            for name in CHROME_SINGLETON_FILES:
+                try:
+                    os.unlink(self.path / name)
+                except FileNotFoundError:
+                    pass
+
+        self.prune()
+        return True
+
+    def _has_singletons(self):
+        return any(os.path.lexists(self.path / name) for name in CHROME_SINGLETON_FILES)
+
+    def _singleton_owner(self):
+        """The "<hostname>-<pid>" SingletonLock points at, or None."""
+        try:
+            return os.readlink(self.path / "SingletonLock")
+        except OSError:
+            return None
+
+    @staticmethod
+    def _owner_is_dead(owner):
+        if owner is None:
+            # No lock to name an owner: the other files are leftovers
+            return True
+        host, _, pid = owner.rpartition("-")
+        if host != socket.gethostname() or not pid.isdigit():
+            # Another host's browser can't be checked from here
+            return False
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            return False
+        return False
+
+    def release(self):
+        if self._lock_fd is None:
+            return
+        try:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+    def prune(self):
+        """Delete the oldest cache files until the profile is under 80% of its cap."""
+        total = _dir_size(self.path)
+        if total <= self.max_bytes:
+            logger.info(f"Chrome profile size {total // 1024} KB (cap {self.max_bytes // 1024} KB)")
+            return
+
+        cache_files = []
+        for rel in PRUNABLE_DIRS:
+            for root, _, files in os.walk(self.path / rel):
+                for name in files:
+                    file_path = os.path.join(root, name)
+                    try:
+                        stat = os.lstat(file_path)
+                    except OSError:
+                        continue
+                    cache_files.append((stat.st_mtime, stat.st_size, file_path))
+
+        target = int(self.max_bytes * 0.8)
+        removed = 0
+        for _, size, file_path in sorted(cache_files):
+            if total <= target:
+                break
+            try:
+                os.unlink(file_path)
+            except OSError:
+                continue
+            total -= size
+            removed += size
+
+        logger.info(f"Pruned {removed // 1024} KB from Chrome profile, now {total // 1024} KB")
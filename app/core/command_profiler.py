@@ -0,0 +1,94 @@
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+
+from core.logger import logger
+from core.metrics import metrics
+
+# Call sites are attributed to the innermost frame in one of these files
+TRACKED_FILES = ("update_resume_flow.py", "session_manager.py")
+
+# Generic lookup helpers called from every step; their commands are charged
+# to the function that called them, shown as "caller > helper"
+HELPER_FUNCTIONS = {"wait_for", "wait_clickable", "find_named", "find_file_input"}
+
+
+def _call_site():
+    frame = sys._getframe(2)
+    helper = None
+    while frame is not None:
+        filename = os.path.basename(frame.f_code.co_filename)
+        if filename in TRACKED_FILES:
+            name = frame.f_code.co_name
+            if name not in HELPER_FUNCTIONS:
+                site = f"{filename}:{name}"
+                return f"{site} > {helper}" if helper else site
+            helper = helper or name
+        frame = frame.f_back
+    return helper or "<other>"
+
+
+class CommandProfiler:
+    """
+    Records every driver command with its duration and calling function.
+
+    Both Selenium drivers and CdpDriver funnel each round trip (including
+    WebDriverWait polls and WebElement calls) through driver.execute, so
+    wrapping that one method sees every command.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.records = []
+
+    def attach(self, driver):
+        original_execute = driver.execute
+
+        def profiled_execute(command, params=None):
+            site = _call_site()
+            start = time.perf_counter()
+            try:
+                return original_execute(command, params)
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                with self._lock:
+                    self.records.append((command, elapsed_ms, site))
+
+        driver.execute = profiled_execute
+        logger.info("WebDriver command profiling enabled")
+        return driver
+
+    def _aggregate(self, key_index):
+        totals = defaultdict(lambda: [0, 0.0])
+        for record in self.records:
+            entry = totals[record[key_index]]
+            entry[0] += 1
+            entry[1] += record[1]
+        return totals
+
+    def report(self, top_n=15):
+        """Log the top-N call sites and commands by count and by cumulative time."""
+        with self._lock:
+            if not self.records:
+                return
+            total_ms = sum(r[1] for r in self.records)
+            metrics.record("driver_commands_total", len(self.records))
+            metrics.record("driver_command_ms_total", round(total_ms, 1))
+
+            logger.info(f"⏱ {len(self.records)} driver commands, {total_ms / 1000:.1f} s total")
+            for title, key_index in (("call site", 2), ("command", 0)):
+                totals = self._aggregate(key_index)
+                for order, sort_index in (("count", 0), ("cumulative time", 1)):
+                    logger.info(f"Top {top_n} by {title}, {order}:")
+                    ranked = sorted(totals.items(), key=lambda item: item[1][sort_index], reverse=True)
+                    for name, (count, elapsed_ms) in ranked[:top_n]:
+                        logger.info(f"   {count:>6}  {elapsed_ms:>10.1f} ms  {name}")
+
+    def reset(self):
+        with self._lock:
+            self.records = []
+
+
+command_profiler = CommandProfiler()
@@ -1,37 +1,98 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
 from selenium.common.exceptions import SessionNotCreatedException
 from config.settings import Settings
 from core.logger import logger
+from core.cdp_driver import CdpDriver
+from core.command_profiler import command_profiler
+from core.chrome_profile import ChromeProfile
+from core.session_trace import SessionRecorder
+import atexit
+import shutil
+import threading
 import time
 import requests
 
 
+class LocalChromeDriver(webdriver.Remote):
+    """
+    A session on the shared in-container chromedriver service.
+
+    webdriver.Chrome would start and stop its own chromedriver per session;
+    attaching a Remote client to a long-lived service keeps one chromedriver
+    process for every session in this process.
+    """
+
+    def __init__(self, service_url, options):
+        executor = ChromiumRemoteConnection(
+            remote_server_addr=service_url,
+            vendor_prefix="goog",
+            browser_name="chrome",
+            ignore_proxy=options._ignore_local_proxy,
+        )
+        super().__init__(command_executor=executor, options=options)
+        # Browser and app share a filesystem, so file inputs take local paths
+        self._is_remote = False
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+
 class DriverFactory:
+    _local_service = None
+    _local_service_lock = threading.Lock()
+
     @staticmethod
-    def create_driver():
-        selenium_url = "http://selenium:4444/wd/hub"
+    def create_driver(mode=None, selenium_url=None):
+        """
+        Create a browser driver for the configured DRIVER_MODE.
 
-        # ✅ WAIT FOR SELENIUM TO BE READY
-        logger.info("Waiting for Selenium Grid to be ready...")
-        start = time.time()
-        while time.time() - start < 60:
-            try:
-                response = requests.get("http://selenium:4444/wd/hub/status", timeout=5)
-                if response.status_code == 200:
-                    status = response.json()
-                    if status.get("value", {}).get("ready", False):
-                        logger.info("✓ Selenium Grid is ready")
-                        # Give Selenium more time to fully initialize and free up memory
-                        logger.info("Waiting 5 seconds for Selenium to stabilize...")
-                        time.sleep(5)
-                        break
-            except Exception as e:
-                logger.debug(f"Selenium not ready yet: {e}")
-            time.sleep(2)
-        else:
-            raise RuntimeError("❌ Selenium did not become ready in time")
+        grid:  Selenium Remote session on selenium_url (default SELENIUM_URL)
+        local: headless Chrome in this container through a shared chromedriver service
+        cdp:   local headless Chromium driven directly over the DevTools websocket
+        """
+        mode = (mode or Settings.DRIVER_MODE).lower()
+        started = time.perf_counter()
+        options = DriverFactory.build_options()
+        profile = DriverFactory._acquire_profile(mode, selenium_url or Settings.SELENIUM_URL)
+        if Settings.NETWORK_UPLOAD_CONFIRM and mode != "grid":
+            logger.warning(f"NETWORK_UPLOAD_CONFIRM needs DRIVER_MODE=grid (selenium-wire) - ignored in {mode} mode")
+
+        try:
+            if mode == "cdp":
+                driver = CdpDriver.launch(options, user_data_dir=str(profile.path) if profile else None)
+                driver.implicitly_wait(Settings.WAIT_TIME)
+                driver.set_page_load_timeout(60)
+            else:
+                if profile:
+                    options.add_argument(f"--user-data-dir={profile.path}")
+                if mode == "local":
+                    driver = DriverFactory._create_local_driver(options)
+                elif mode == "grid":
+                    driver = DriverFactory._create_grid_driver(options, selenium_url or Settings.SELENIUM_URL)
+                else:
+                    raise ValueError(f"❌ Unknown DRIVER_MODE: {mode} (expected 'grid', 'local' or 'cdp')")
+        except Exception:
+            if profile:
+                profile.release()
+            raise
 
+        if profile:
+            DriverFactory._release_profile_on_quit(driver, profile)
+
+        if Settings.PROFILE_COMMANDS:
+            command_profiler.attach(driver)
+        if Settings.RECORD_SESSION_DIR:
+            SessionRecorder(Settings.RECORD_SESSION_DIR).attach(
+                driver, startup_ms=(time.perf_counter() - started) * 1000
+            )
+        return driver
+
+    @staticmethod
+    def build_options():
+        """Hardened, memory-lean Chrome options shared by every backend."""
         options = Options()
 
         # Essential flags for containerized environments (minimal set)
@@ -78,15 +139,140 @@ class DriverFactory:
         }
         options.add_experimental_option("prefs", prefs)
 
+        return options
+
+    @staticmethod
+    def _acquire_profile(mode, selenium_url):
+        """Lock the persistent Chrome profile, or return None to run with a fresh one."""
+        if not Settings.CHROME_PROFILE_DIR:
+            return None
+
+        profile = ChromeProfile(Settings.CHROME_PROFILE_DIR, Settings.CHROME_PROFILE_MAX_MB)
+        # On a Grid the browser runs on the node, where its pid can't be checked;
+        # a crashed run's leftovers are safe to clear once the Grid has no sessions
+        remote_idle = (lambda: DriverFactory._grid_is_idle(selenium_url)) if mode == "grid" else None
+        if not profile.acquire(remote_idle=remote_idle):
+            logger.warning(
+                f"Chrome profile {Settings.CHROME_PROFILE_DIR} is in use by another run or browser - "
+                "starting with an empty profile"
+            )
+            return None
+
+        logger.info(f"✓ Using persistent Chrome profile: {Settings.CHROME_PROFILE_DIR}")
+        return profile
+
+    @staticmethod
+    def _grid_is_idle(selenium_url):
+        """True if the Grid answers and none of its slots holds a session."""
+        try:
+            response = requests.get(f"{selenium_url}/status", timeout=5)
+            response.raise_for_status()
+            nodes = response.json()["value"]["nodes"]
+        except Exception as e:
+            logger.warning(f"Could not read Selenium Grid status: {e}")
+            return False
+        return not any(slot.get("session") for node in nodes for slot in node.get("slots", []))
+
+    @staticmethod
+    def _release_profile_on_quit(driver, profile):
+        original_quit = driver.quit
+
+        def quit_and_release():
+            try:
+                original_quit()
+            finally:
+                profile.release()
+
+        driver.quit = quit_and_release
+
+    @staticmethod
+    def _get_local_service():
+        """Start chromedriver on first use and reuse it for every later session."""
+        with DriverFactory._local_service_lock:
+            service = DriverFactory._local_service
+            if service is None or service.process is None or service.process.poll() is not None:
+                logger.info(f"Starting local chromedriver service: {Settings.CHROMEDRIVER_PATH}")
+                service = Service(executable_path=Settings.CHROMEDRIVER_PATH)
+                service.start()
+                atexit.register(service.stop)
+                DriverFactory._local_service = service
+                logger.info(f"✓ chromedriver listening at {service.service_url}")
+            return service
+
+    @staticmethod
+    def _create_local_driver(options):
+        binary = shutil.which(Settings.CHROME_BINARY)
+        if binary:
+            options.binary_location = binary
+
+        service = DriverFactory._get_local_service()
+        logger.info("Creating local WebDriver session (no Selenium Grid)...")
+        driver = LocalChromeDriver(service.service_url, options)
+        logger.info("✓ WebDriver session created successfully")
+        driver.implicitly_wait(Settings.WAIT_TIME)
+        driver.set_page_load_timeout(60)
+        return driver
+
+    @staticmethod
+    def _create_grid_driver(options, selenium_url):
+
+        # ✅ WAIT FOR SELENIUM TO BE READY
+        logger.info(f"Waiting for Selenium Grid to be ready at {selenium_url}...")
+        start = time.time()
+        while time.time() - start < 60:
+            try:
+                response = requests.get(f"{selenium_url}/status", timeout=5)
+                if response.status_code == 200:
+                    status = response.json()
+                    if status.get("value", {}).get("ready", False):
+                        logger.info("✓ Selenium Grid is ready")
+                        # Give Selenium more time to fully initialize and free up memory
+                        logger.info("Waiting 5 seconds for Selenium to stabilize...")
+                        time.sleep(5)
+                        break
+            except Exception as e:
+                logger.debug(f"Selenium not ready yet: {e}")
+            time.sleep(2)
+        else:
+            raise RuntimeError("❌ Selenium did not become ready in time")
+
+        seleniumwire_options = None
+        if Settings.NETWORK_UPLOAD_CONFIRM:
+            # Route browser traffic through a selenium-wire proxy running in this
+            # container so the upload request/response can be inspected locally.
+            # auto_config is off because selenium-wire's Remote capability
+            # injection predates Selenium 4 options; the proxy is set explicitly.
+            seleniumwire_options = {
+                "addr": "0.0.0.0",
+                "port": Settings.SELENIUM_WIRE_PORT,
+                "auto_config": False,
+            }
+            options.add_argument(
+                f"--proxy-server=http://{Settings.SELENIUM_WIRE_HOST}:{Settings.SELENIUM_WIRE_PORT}"
+            )
+            options.add_argument("--ignore-certificate-errors")
+            options.set_capability("acceptInsecureCerts", True)
+            logger.info("Network upload confirmation enabled (selenium-wire proxy)")
+
         # Try to create driver with retries
         max_retries = 3
         for attempt in range(max_retries):
             try:
                 logger.info(f"Attempting to create WebDriver session (attempt {attempt + 1}/{max_retries})...")
-                driver = webdriver.Remote(
-                    command_executor=selenium_url,
-                    options=options
-                )
+                if seleniumwire_options is not None:
+                    from seleniumwire import webdriver as wire_webdriver
+                    driver = wire_webdriver.Remote(
+                        command_executor=selenium_url,
+                        options=options,
+                        seleniumwire_options=dict(seleniumwire_options),
+                    )
+                    # selenium-wire matches scopes case-sensitively; upload_monitor doesn't
+                    driver.scopes = [f"(?i){Settings.UPLOAD_REQUEST_PATTERN}"]
+                else:
+                    driver = webdriver.Remote(
+                        command_executor=selenium_url,
+                        options=options
+                    )
                 logger.info("✓ WebDriver session created successfully")
                 driver.implicitly_wait(Settings.WAIT_TIME)
                 driver.set_page_load_timeout(60)
@@ -109,7 +295,7 @@ class DriverFactory:
                     logger.error("Failed to create WebDriver session after all retries")
                     # Log Selenium Grid status for debugging
                     try:
-                        status_response = requests.get("http://selenium:4444/wd/hub/status", timeout=5)
+                        status_response = requests.get(f"{selenium_url}/status", timeout=5)
                         logger.info(f"Selenium Grid status: {status_response.json()}")
                     except Exception as status_error:
                         logger.warning(f"Could not get Selenium status: {status_error}")
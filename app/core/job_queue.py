@@ -0,0 +1,177 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from core.logger import logger
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    account TEXT NOT NULL,
+    shard INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    enqueued_at REAL NOT NULL,
+    available_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    worker TEXT,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (status, shard, available_at);
+"""
+
+
+class JobQueue:
+    """
+    Account refresh jobs in a local SQLite database.
+
+    Jobs are pending, running, done or failed. Claiming is a single
+    IMMEDIATE transaction, so several threads or processes can share one
+    database file. A job becomes claimable at available_at, which is how
+    retries back off and rate-limited jobs are deferred.
+
+    A claim is identified by the job id and its attempt number. A job
+    requeued by recover_stale while its worker is in fact still alive is
+    claimed again under a new attempt number, so the old worker's complete,
+    fail, retry or defer no longer matches and changes nothing.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._connection().executescript(SCHEMA)
+
+    def _connection(self):
+        """One autocommit connection per thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _connect(self):
+        return _Transaction(self._connection())
+
+    def enqueue(self, account, shard):
+        """Add a job for account unless one is already pending or running. Returns its id or None."""
+        now = time.time()
+        with self._connect() as conn:
+            existing = conn.execute(
+                "SELECT id FROM jobs WHERE account = ? AND status IN ('pending', 'running')",
+                (account,),
+            ).fetchone()
+            if existing:
+                return None
+            cursor = conn.execute(
+                "INSERT INTO jobs (account, shard, enqueued_at, available_at) VALUES (?, ?, ?, ?)",
+                (account, shard, now, now),
+            )
+            return cursor.lastrowid
+
+    def claim(self, shard, worker):
+        """Mark the oldest ready job in shard as running and return it, or None."""
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = 'pending' AND shard = ? AND available_at <= ? "
+                "ORDER BY available_at, id LIMIT 1",
+                (shard, now),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, started_at = ?, worker = ? "
+                "WHERE id = ?",
+                (now, worker, row["id"]),
+            )
+        job = dict(row)
+        job["attempts"] += 1
+        job["lag"] = now - job["available_at"]
+        return job
+
+    # Each of these returns False, changing nothing, if the claim was lost
+
+    def complete(self, job):
+        return self._update(job, "status = 'done', finished_at = ?", (time.time(),))
+
+    def fail(self, job, error):
+        return self._update(job, "status = 'failed', finished_at = ?, last_error = ?", (time.time(), error))
+
+    def retry(self, job, delay, error):
+        """Put a failed attempt back in the queue after delay seconds."""
+        return self._update(job, "status = 'pending', available_at = ?, last_error = ?", (time.time() + delay, error))
+
+    def defer(self, job, delay):
+        """Release a claimed job unrun, without counting the attempt."""
+        return self._update(job, "status = 'pending', attempts = attempts - 1, available_at = ?", (time.time() + delay,))
+
+    def _update(self, job, assignments, params):
+        with self._connect() as conn:
+            cursor = conn.execute(
+                f"UPDATE jobs SET {assignments} WHERE id = ? AND status = 'running' AND attempts = ?",
+                (*params, job["id"], job["attempts"]),
+            )
+        if not cursor.rowcount:
+            logger.warning(f"Job {job['id']} ({job['account']}) was reclaimed after attempt {job['attempts']} - result dropped")
+            return False
+        return True
+
+    def recover_stale(self, timeout):
+        """Return jobs left running by a crashed worker to the queue."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'pending', available_at = ? "
+                "WHERE status = 'running' AND started_at < ?",
+                (time.time(), time.time() - timeout),
+            )
+        if cursor.rowcount:
+            logger.warning(f"Requeued {cursor.rowcount} stale running job(s)")
+        return cursor.rowcount
+
+    def has_work(self, shard=None):
+        """True while any job (in shard, if given) is pending or running."""
+        query = "SELECT 1 FROM jobs WHERE status IN ('pending', 'running')"
+        params = ()
+        if shard is not None:
+            query += " AND shard = ?"
+            params = (shard,)
+        with self._connect() as conn:
+            return conn.execute(query + " LIMIT 1", params).fetchone() is not None
+
+    def depth(self):
+        """Job counts by status, plus how many pending jobs are ready to run now."""
+        with self._connect() as conn:
+            counts = {status: 0 for status in ("pending", "running", "done", "failed")}
+            for row in conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status"):
+                counts[row["status"]] = row["n"]
+            counts["ready"] = conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = 'pending' AND available_at <= ?",
+                (time.time(),),
+            ).fetchone()[0]
+        return counts
+
+    def failed_jobs(self):
+        with self._connect() as conn:
+            return [dict(row) for row in conn.execute(
+                "SELECT account, attempts, last_error FROM jobs WHERE status = 'failed' ORDER BY id"
+            )]
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT around a block, rolled back on error."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
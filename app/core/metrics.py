@@ -0,0 +1,55 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from core.logger import logger
+
+
+class RunMetrics:
+    """Named measurements collected during a single automation run."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.values = {}
+
+    def record(self, name, value):
+        """Set a metric to the given value (last write wins)."""
+        with self._lock:
+            self.values[name] = value
+
+    def increment(self, name, amount=1):
+        """Add amount to a counter metric, creating it if needed."""
+        with self._lock:
+            self.values[name] = self.values.get(name, 0) + amount
+
+    def get(self, name, default=None):
+        with self._lock:
+            return self.values.get(name, default)
+
+    @contextmanager
+    def timer(self, name):
+        """Record the wall time of the wrapped block in milliseconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, round((time.perf_counter() - start) * 1000, 1))
+
+    def reset(self):
+        with self._lock:
+            self.values = {}
+
+    def log_summary(self):
+        """Log all recorded metrics, one per line."""
+        with self._lock:
+            items = sorted(self.values.items())
+
+        if not items:
+            return
+
+        logger.info("📊 Run metrics:")
+        for name, value in items:
+            logger.info(f"   {name} = {value}")
+
+
+metrics = RunMetrics()
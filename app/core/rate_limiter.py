@@ -0,0 +1,56 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """Allows `capacity` events at once, refilled at `rate` tokens per second."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def reserve(self):
+        """Take a token if one is available. Returns 0, or the seconds until one will be."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """
+    Token buckets keyed by name (a target host, an account), created on
+    first use. Buckets live in this process, so separate worker processes
+    each get the full budget.
+    """
+
+    def __init__(self, rate, capacity):
+        if rate <= 0 or capacity < 1:
+            raise ValueError(f"❌ Rate limits need rate > 0 and capacity >= 1 (got {rate}, {capacity})")
+        self.rate = rate
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def reserve(self, key):
+        """Take a token for key without waiting. Returns 0, or the seconds to wait."""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self.rate, self.capacity)
+            return bucket.reserve()
+
+    def acquire(self, key):
+        """Block until a token for key is available. Returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            delay = self.reserve(key)
+            if not delay:
+                return waited
+            time.sleep(delay)
+            waited += delay
@@ -0,0 +1,258 @@
+import copy
+import json
+import re
+import time
+from datetime import date
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+
+from config.settings import Settings
+from core.logger import logger
+
+# Commands whose responses carry cookie values
+COOKIE_RESPONSE_COMMANDS = ("getCookies", "getCookie")
+
+# Directories differ between runs and hosts (temp dirs, Grid upload dirs);
+# only the file name of a resume path is kept
+PDF_DIR_RE = re.compile(r"(?<![\w<])(?:/[^/\s\"'<>]+)+/(?=[^/\s\"'<>]+\.pdf\b)")
+
+# Settings that change which commands the flow issues; a replay runs with
+# the values the trace was recorded with
+REPLAYED_SETTINGS = ("BASE_URL", "LOGIN_URL", "NAUKRI_PROFILE_URL", "SKIP_UPLOAD_IF_CURRENT", "WAIT_TIME")
+
+# How far ahead of the cursor a replayed command may match; commands skipped
+# over are ones the new code no longer issues (e.g. fewer wait polls)
+LOOKAHEAD = 200
+
+
+class ReplayMismatch(WebDriverException):
+    """The flow issued a command that never appears in the trace."""
+
+
+class Scrubber:
+    """
+    Makes command params and responses safe to store and comparable across
+    runs: credentials become placeholders, cookie values are dropped and
+    resume file paths lose their directory.
+    """
+
+    def __init__(self, secrets):
+        # Longest first, so a password containing the email is still caught whole
+        self.secrets = sorted(
+            ((value, f"<{name}>") for name, value in secrets.items() if value),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+
+    def _string(self, value):
+        for secret, placeholder in self.secrets:
+            value = value.replace(secret, placeholder)
+        return PDF_DIR_RE.sub("<dir>/", value)
+
+    def value(self, value):
+        if isinstance(value, str):
+            return self._string(value)
+        if isinstance(value, list):
+            return [self.value(v) for v in value]
+        if isinstance(value, dict):
+            return {k: self.value(v) for k, v in value.items()}
+        return value
+
+    def params(self, command, params):
+        params = self.value(copy.deepcopy(params or {}))
+        if command == "addCookie" and "cookie" in params:
+            params["cookie"]["value"] = "<cookie>"
+        if command == "sendKeysToElement" and "text" in params:
+            # Keys are also sent one character per item, which no string replace catches
+            params["value"] = list(params["text"])
+        if command == "uploadFile":
+            # The zipped file itself; whatever was uploaded, the command is the same
+            params["file"] = "<file>"
+        return params
+
+    def response(self, command, response):
+        response = self.value(copy.deepcopy(response))
+        if command in COOKIE_RESPONSE_COMMANDS and isinstance(response, dict):
+            cookies = response.get("value")
+            for cookie in cookies if isinstance(cookies, list) else [cookies]:
+                if isinstance(cookie, dict) and "value" in cookie:
+                    cookie["value"] = "<cookie>"
+        return response
+
+    @classmethod
+    def from_settings(cls):
+        return cls({"email": Settings.NAUKRI_EMAIL, "password": Settings.NAUKRI_PASSWORD})
+
+
+def _entry_key(command, params):
+    return json.dumps([command, params], sort_keys=True)
+
+
+class SessionRecorder:
+    """
+    Records every WebDriver command of a session with its response and
+    latency, for replay by ReplayDriver.
+
+    Recording wraps the driver's command executor, below Selenium's own
+    element wrapping, so the trace holds the raw wire-protocol JSON. The
+    session is already open when the recorder attaches, so its newSession
+    entry is synthesised from the driver. The trace is written when the
+    driver quits.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    def attach(self, driver, startup_ms=0.0):
+        if not hasattr(driver, "command_executor"):
+            logger.warning("Session recording needs a WebDriver backend (grid or local) - not recording")
+            return driver
+        if Settings.NETWORK_UPLOAD_CONFIRM:
+            logger.warning("Upload confirmation via proxy is not part of the WebDriver trace; replays fall back to page checks")
+
+        scrubber = Scrubber.from_settings()
+        started = time.perf_counter()
+        entries = [{
+            "command": "newSession",
+            "params": {},
+            "response": {"value": {"sessionId": driver.session_id, "capabilities": driver.caps}},
+            "ms": round(startup_ms, 1),
+            "t": 0.0,
+        }]
+
+        executor = driver.command_executor
+        original_execute = executor.execute
+
+        def recording_execute(command, params):
+            offset = time.perf_counter() - started
+            start = time.perf_counter()
+            response = original_execute(command, params)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            # Selenium unwraps the response in place after this returns
+            entries.append({
+                "command": command,
+                "params": scrubber.params(command, params),
+                "response": scrubber.response(command, response),
+                "ms": round(elapsed_ms, 1),
+                "t": round(offset * 1000 + startup_ms, 1),
+            })
+            return response
+
+        executor.execute = recording_execute
+
+        meta = {
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            # The day the flow compared the profile's upload date against
+            "recorded_on": date.today().isoformat(),
+            "driver_mode": Settings.DRIVER_MODE,
+            "is_remote": driver._is_remote,
+            "execute_cdp_cmd": hasattr(driver, "execute_cdp_cmd"),
+            "resume_name": Path(Settings.RESUME_TEMP_PATH).name,
+            "settings": {name: getattr(Settings, name) for name in REPLAYED_SETTINGS},
+        }
+
+        original_quit = driver.quit
+
+        def quit_and_save():
+            try:
+                original_quit()
+            finally:
+                self._save(driver.session_id or entries[0]["response"]["value"]["sessionId"], meta, entries)
+
+        driver.quit = quit_and_save
+        logger.info(f"Recording WebDriver session to {self.directory}")
+        return driver
+
+    def _save(self, session_id, meta, entries):
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / f"{time.strftime('%Y%m%d-%H%M%S')}-{str(session_id)[:8]}.json"
+            with open(path, "w") as f:
+                json.dump({"meta": meta, "entries": entries}, f, indent=1)
+            logger.info(f"✓ Saved session trace with {len(entries)} commands to {path}")
+        except Exception as e:
+            logger.warning(f"Could not save session trace: {e}")
+
+
+def load_trace(path):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+class ReplayCommandExecutor:
+    """
+    Serves recorded responses in place of a browser.
+
+    Each command is matched (by command and scrubbed params) to the next
+    recorded occurrence within LOOKAHEAD entries of the cursor; recorded
+    commands jumped over are counted as skipped. A command issued more often
+    than recorded (an extra wait poll) reuses its latest match. Each served
+    command costs its recorded latency times latency_scale, spent through
+    time.sleep so a virtual clock can absorb it.
+    """
+
+    def __init__(self, trace, scrubber, latency_scale=1.0):
+        self.entries = trace["entries"]
+        self.keys = [_entry_key(e["command"], e["params"]) for e in self.entries]
+        self.scrubber = scrubber
+        self.latency_scale = latency_scale
+        self.cursor = 0
+        self.served = 0
+        self.skipped = 0
+        self.reused = 0
+        self.latency_s = 0.0
+        self._last_match = {}
+
+    def execute(self, command, params):
+        if command == "newSession":
+            # Capabilities depend on local settings; the session itself is what matters
+            index = next(i for i, e in enumerate(self.entries) if e["command"] == "newSession")
+        else:
+            index = self._match(_entry_key(command, self.scrubber.params(command, params)), command)
+
+        entry = self.entries[index]
+        self.served += 1
+        latency = entry["ms"] * self.latency_scale / 1000
+        self.latency_s += latency
+        if latency:
+            time.sleep(latency)
+        return copy.deepcopy(entry["response"])
+
+    def _match(self, key, command):
+        window_end = min(len(self.keys), self.cursor + LOOKAHEAD)
+        for index in range(self.cursor, window_end):
+            if self.keys[index] == key:
+                self.skipped += index - self.cursor
+                self.cursor = index + 1
+                self._last_match[key] = index
+                return index
+
+        if key in self._last_match:
+            self.reused += 1
+            return self._last_match[key]
+
+        raise ReplayMismatch(
+            f"Command not in trace near entry {self.cursor}: {command} {key[:300]}"
+        )
+
+    def close(self):
+        pass
+
+
+class ReplayDriver(webdriver.Remote):
+    """A Remote driver whose commands are answered from a recorded trace."""
+
+    def __init__(self, trace, scrubber, latency_scale=1.0):
+        self.replay = ReplayCommandExecutor(trace, scrubber, latency_scale)
+        super().__init__(command_executor=self.replay, options=Options())
+        meta = trace["meta"]
+        # Mirror the recorded backend so the flow takes the same code paths
+        self._is_remote = meta["is_remote"]
+        if meta["execute_cdp_cmd"]:
+            self.execute_cdp_cmd = self._execute_cdp_cmd
+
+    def _execute_cdp_cmd(self, cmd, cmd_args):
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
@@ -0,0 +1,128 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from selenium.common.exceptions import TimeoutException
+
+from config.settings import Settings
+from core.logger import logger
+from core.metrics import metrics
+
+# Samples kept per wait; older ones age out so the timeouts follow the site
+MAX_SAMPLES = 50
+
+
+class _Wait:
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self.ok = True
+
+
+class WaitTimings:
+    """
+    How long each named wait took in previous runs, and whether it succeeded.
+
+    A named wait's timeout is a high percentile of its successful durations
+    times a safety margin, clamped between a floor and the caller's default,
+    which stays the ceiling. Until enough samples exist the default is used.
+    A miss at a shortened timeout restores the default for the next call, so
+    a retried step always gets the full budget. Only waits marked optional
+    (elements that are often absent, e.g. the chatbot) drop to the floor when
+    they have never succeeded; any other wait keeps its default until it has
+    successes to learn from.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._samples = None
+
+    def _load(self):
+        if self._samples is not None:
+            return
+        self._samples = {}
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path, "r") as f:
+                self._samples = json.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable wait timings {self.path}: {e}")
+
+    def timeout(self, name, default, floor=None, optional=False):
+        """The timeout to use for this wait, in seconds."""
+        floor = min(default, floor if floor is not None else Settings.ADAPTIVE_TIMEOUT_FLOOR)
+        if not name or not Settings.ADAPTIVE_TIMEOUTS:
+            return default
+
+        with self._lock:
+            self._load()
+            samples = list(self._samples.get(name, ()))
+
+        if len(samples) < Settings.ADAPTIVE_MIN_SAMPLES:
+            return default
+
+        successes = sorted(seconds for seconds, ok, _ in samples if ok)
+        if not successes:
+            # Optional waits stay at the floor rather than alternating with the
+            # default; a required one keeps its full budget until it succeeds
+            return floor if optional else default
+
+        _, last_ok, last_timeout = samples[-1]
+        if not last_ok and last_timeout < default:
+            return default
+
+        index = min(len(successes) - 1, int(len(successes) * Settings.ADAPTIVE_TIMEOUT_PERCENTILE / 100))
+        learned = successes[index] * Settings.ADAPTIVE_TIMEOUT_MARGIN_PCT / 100
+        return round(max(floor, min(default, learned)), 2)
+
+    def record(self, name, seconds, ok, timeout):
+        with self._lock:
+            self._load()
+            samples = self._samples.setdefault(name, [])
+            samples.append([round(seconds, 3), ok, timeout])
+            del samples[:-MAX_SAMPLES]
+
+    @contextmanager
+    def adaptive(self, name, default, floor=None, optional=False):
+        """
+        Time a named wait. Yields an object whose .timeout is the timeout to
+        pass on; set .ok = False if the wait came back empty. A
+        TimeoutException counts as a miss and is re-raised. Unnamed waits
+        keep their default and are not recorded. optional marks elements
+        whose absence is normal, which may drop to the floor.
+        """
+        if not name:
+            yield _Wait(default)
+            return
+
+        wait = _Wait(self.timeout(name, default, floor, optional))
+        if wait.timeout < default:
+            metrics.increment("adaptive_timeout_budget_saved_s", round(default - wait.timeout, 2))
+        start = time.monotonic()
+        try:
+            yield wait
+        except TimeoutException:
+            self.record(name, time.monotonic() - start, False, wait.timeout)
+            raise
+        # Other errors say nothing about how long the element takes and are not recorded
+        self.record(name, time.monotonic() - start, wait.ok, wait.timeout)
+
+    def save(self):
+        with self._lock:
+            if not self.path or self._samples is None:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(".tmp")
+                with open(tmp_path, "w") as f:
+                    json.dump(self._samples, f, indent=2)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                logger.warning(f"Could not save wait timings: {e}")
+
+
+wait_timings = WaitTimings(Settings.WAIT_TIMINGS_FILE)
@@ -0,0 +1,249 @@
+"""
+Queue-driven resume refresh for many accounts.
+
+    python app/fleet.py enqueue     # one job per account in FLEET_ACCOUNTS_FILE
+    python app/fleet.py work        # run workers until the queue is drained
+    python app/fleet.py run         # enqueue, then work
+    python app/fleet.py status      # queue depth and failed jobs
+
+Jobs live in a SQLite queue (FLEET_QUEUE_DB). Each account is pinned to a
+shard, and each shard to one Grid endpoint from GRID_URLS, served by
+FLEET_WORKERS_PER_SHARD worker threads. `work --shard N` serves a single
+shard, so shards can also be split across processes or containers sharing
+the database. Every job runs the same per-run UpdateResumeFlow as main.py,
+with its own cookies, resume download and checkpoint.
+
+Logins are rate limited with token buckets: FLEET_HOST_RATE_PER_MIN for the
+Naukri host across all accounts, and FLEET_ACCOUNT_RATE_PER_HOUR per
+account. Failed jobs are retried with exponential backoff up to
+FLEET_MAX_ATTEMPTS.
+"""
+import argparse
+import sys
+import threading
+import time
+import zlib
+from urllib.parse import urlparse
+
+from config.accounts import load_accounts
+from config.settings import Settings
+from core.driver_factory import DriverFactory
+from core.job_queue import JobQueue
+from core.logger import logger
+from core.metrics import metrics
+from core.rate_limiter import RateLimiter
+from core.wait_timings import wait_timings
+from workflows.update_resume_flow import UpdateResumeFlow
+
+IDLE_POLL_SECONDS = 5
+
+
+def grid_endpoints():
+    """One endpoint per shard; local and cdp modes run a single local shard."""
+    if Settings.DRIVER_MODE.lower() != "grid":
+        return [None]
+    urls = [url.strip().rstrip("/") for url in Settings.GRID_URLS.split(",") if url.strip()]
+    return urls or [Settings.SELENIUM_URL]
+
+
+def shard_for(account_key, shard_count):
+    # Stable across runs, so an account keeps using the same Grid
+    return zlib.crc32(account_key.encode()) % shard_count
+
+
+def enqueue_all(queue, accounts, shard_count):
+    added = 0
+    for key in accounts:
+        if queue.enqueue(key, shard_for(key, shard_count)) is not None:
+            added += 1
+    logger.info(f"Enqueued {added} job(s), {len(accounts) - added} already queued")
+
+
+def run_account(account, endpoint):
+    """One account's refresh: the same fresh-driver run main.py does."""
+    driver = DriverFactory.create_driver(selenium_url=endpoint)
+    try:
+        UpdateResumeFlow(account=account).run(driver)
+    finally:
+        driver.quit()
+
+
+class FleetExecutor:
+
+    def __init__(self, queue, accounts, endpoints):
+        self.queue = queue
+        self.accounts = accounts
+        self.endpoints = endpoints
+        self.host = urlparse(Settings.BASE_URL).hostname
+        self.host_limiter = RateLimiter(Settings.FLEET_HOST_RATE_PER_MIN / 60, Settings.FLEET_HOST_BURST)
+        self.account_limiter = RateLimiter(Settings.FLEET_ACCOUNT_RATE_PER_HOUR / 3600, 1)
+        self.stop = threading.Event()
+        self._lag_lock = threading.Lock()
+        self.started_at = time.time()
+
+    def work(self, shards):
+        threads = []
+        for shard in shards:
+            for index in range(Settings.FLEET_WORKERS_PER_SHARD):
+                thread = threading.Thread(
+                    target=self._worker,
+                    args=(shard, f"shard{shard}-w{index}"),
+                    name=f"fleet-shard{shard}-w{index}",
+                )
+                thread.start()
+                threads.append(thread)
+
+        reporter = threading.Thread(target=self._report_loop, daemon=True)
+        reporter.start()
+        try:
+            for thread in threads:
+                thread.join()
+        except KeyboardInterrupt:
+            logger.warning("Stopping workers after their current job...")
+            self.stop.set()
+            for thread in threads:
+                thread.join()
+        self.stop.set()
+        self.report()
+
+    def _worker(self, shard, name):
+        endpoint = self.endpoints[shard]
+        logger.info(f"Worker {name} serving shard {shard} ({endpoint or Settings.DRIVER_MODE})")
+
+        while not self.stop.is_set():
+            self.queue.recover_stale(Settings.FLEET_STALE_JOB_SECONDS)
+            job = self.queue.claim(shard, name)
+            if job is None:
+                if not self.queue.has_work(shard):
+                    return
+                self.stop.wait(IDLE_POLL_SECONDS)
+                continue
+
+            account = self.accounts.get(job["account"])
+            if account is None:
+                self.queue.fail(job, "account not in accounts file")
+                metrics.increment("fleet_jobs_failed")
+                continue
+
+            # A throttled account goes back to the queue rather than holding a worker
+            wait = self.account_limiter.reserve(account.key)
+            if wait:
+                self.queue.defer(job, wait)
+                continue
+            waited = self.host_limiter.acquire(self.host)
+            metrics.increment("fleet_rate_limit_wait_ms", round(waited * 1000))
+
+            metrics.increment("fleet_jobs_started")
+            lag_ms = round(job["lag"] * 1000)
+            metrics.increment("fleet_lag_ms_total", lag_ms)
+            with self._lag_lock:
+                metrics.record("fleet_lag_ms_max", max(metrics.get("fleet_lag_ms_max", 0), lag_ms))
+
+            logger.info(f"[{name}] {account.key}: attempt {job['attempts']}, waited {job['lag']:.0f} s in queue")
+            try:
+                run_account(account, endpoint)
+            except Exception as e:
+                self._handle_failure(job, account, e)
+                continue
+
+            if self.queue.complete(job):
+                metrics.increment("fleet_jobs_done")
+                logger.info(f"[{name}] ✓ {account.key} refreshed")
+
+    def _handle_failure(self, job, account, error):
+        if job["attempts"] >= Settings.FLEET_MAX_ATTEMPTS:
+            if self.queue.fail(job, str(error)):
+                metrics.increment("fleet_jobs_failed")
+            logger.error(f"❌ {account.key} failed after {job['attempts']} attempt(s): {error}")
+            return
+
+        delay = Settings.FLEET_RETRY_DELAY * 2 ** (job["attempts"] - 1)
+        self.queue.retry(job, delay, str(error))
+        metrics.increment("fleet_jobs_retried")
+        logger.warning(f"⚠ {account.key} failed (attempt {job['attempts']}), retrying in {delay} s: {error}")
+
+    def _report_loop(self):
+        while not self.stop.wait(Settings.FLEET_REPORT_INTERVAL):
+            self.report()
+
+    def report(self):
+        """Log and record queue depth, throughput and lag."""
+        depth = self.queue.depth()
+        done = metrics.get("fleet_jobs_done", 0)
+        started = metrics.get("fleet_jobs_started", 0)
+        elapsed_min = max((time.time() - self.started_at) / 60, 1e-6)
+        throughput = round(done / elapsed_min, 2)
+        avg_lag_s = metrics.get("fleet_lag_ms_total", 0) / 1000 / started if started else 0
+
+        metrics.record("fleet_queue_depth", depth["pending"] + depth["running"])
+        metrics.record("fleet_throughput_per_min", throughput)
+        metrics.record("fleet_lag_ms_avg", round(avg_lag_s * 1000))
+        logger.info(
+            f"📬 Queue: {depth['ready']} ready, {depth['pending'] - depth['ready']} backing off, "
+            f"{depth['running']} running, {depth['done']} done, {depth['failed']} failed | "
+            f"{throughput} jobs/min | avg lag {avg_lag_s:.0f} s"
+        )
+
+
+def print_status(queue):
+    depth = queue.depth()
+    print(
+        f"pending {depth['pending']} (ready {depth['ready']}), running {depth['running']}, "
+        f"done {depth['done']}, failed {depth['failed']}"
+    )
+    for job in queue.failed_jobs():
+        print(f"  failed: {job['account']} after {job['attempts']} attempt(s): {job['last_error']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["enqueue", "work", "run", "status"])
+    parser.add_argument("--shard", type=int, action="append", help="serve only this shard (repeatable)")
+    args = parser.parse_args()
+
+    queue = JobQueue(Settings.FLEET_QUEUE_DB)
+    if args.command == "status":
+        print_status(queue)
+        return
+
+    accounts = load_accounts()
+    endpoints = grid_endpoints()
+
+    if args.command in ("enqueue", "run"):
+        enqueue_all(queue, accounts, len(endpoints))
+        if args.command == "enqueue":
+            return
+
+    shards = args.shard or list(range(len(endpoints)))
+    if any(shard >= len(endpoints) for shard in shards):
+        parser.error(f"only {len(endpoints)} shard(s) configured")
+
+    if Settings.NETWORK_UPLOAD_CONFIRM and len(shards) * Settings.FLEET_WORKERS_PER_SHARD > 1:
+        # Every session would need its own selenium-wire proxy port
+        logger.warning("NETWORK_UPLOAD_CONFIRM is disabled for concurrent fleet workers")
+        Settings.NETWORK_UPLOAD_CONFIRM = False
+
+    if Settings.RECORD_SESSION_DIR:
+        # Traces are scrubbed of the .env credentials only, not every account's
+        logger.warning("Session recording is not supported for fleet runs - disabled")
+        Settings.RECORD_SESSION_DIR = ""
+
+    if Settings.CHROME_PROFILE_DIR:
+        # A shared profile would carry one account's cookies into the next account's session
+        logger.warning("CHROME_PROFILE_DIR is disabled for fleet runs")
+        Settings.CHROME_PROFILE_DIR = ""
+
+    logger.info(f"🚀 Fleet: {len(accounts)} account(s), shards {shards}, "
+                f"{Settings.FLEET_WORKERS_PER_SHARD} worker(s) per shard")
+    try:
+        FleetExecutor(queue, accounts, endpoints).work(shards)
+    finally:
+        wait_timings.save()
+        metrics.log_summary()
+
+    if metrics.get("fleet_jobs_failed"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,30 @@
 from core.driver_factory import DriverFactory
 from workflows.update_resume_flow import UpdateResumeFlow
+from config.settings import Settings
 from core.logger import logger
+from core.metrics import metrics
+from core.command_profiler import command_profiler
+from core.wait_timings import wait_timings
 
 def main():
-    driver = DriverFactory.create_driver()
+    # Each attempt gets a fresh browser; completed steps are picked up
+    # from the checkpoint so a retry only repeats the step that failed.
+    flow = UpdateResumeFlow()
     try:
-        UpdateResumeFlow().run(driver)
-    except Exception as e:
-        logger.error(f"Automation failed: {str(e)}")
+        for attempt in range(1, Settings.RUN_ATTEMPTS + 1):
+            driver = DriverFactory.create_driver()
+            try:
+                flow.run(driver)
+                return
+            except Exception as e:
+                logger.error(f"Automation failed (attempt {attempt}/{Settings.RUN_ATTEMPTS}): {str(e)}")
+            finally:
+                driver.quit()
     finally:
-        driver.quit()
+        wait_timings.save()
+        if Settings.PROFILE_COMMANDS:
+            command_profiler.report(Settings.PROFILE_TOP_N)
+        metrics.log_summary()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,143 @@
+"""
+Compare per-command latency and total run time of the browser backends.
+
+Run from the project root inside the app container, e.g.:
+
+    python app/tools/backend_benchmark.py --modes grid local cdp --iterations 50
+    python app/tools/backend_benchmark.py --modes grid cdp --full-run
+
+The command mix mirrors what UpdateResumeFlow issues: navigation, XPath and
+CSS lookups, find_elements scans, execute_script calls and attribute reads.
+--full-run additionally times one complete UpdateResumeFlow per backend
+(uses the real credentials from .env and uploads the resume).
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from urllib.parse import quote
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium.webdriver.common.by import By
+
+from core.checkpoint import Checkpoint
+from core.driver_factory import DriverFactory
+from core.logger import logger
+
+TEST_PAGE = "data:text/html," + quote("""
+<html><body>
+  <div class="resume-section" id="resume">
+    <span class="truncate">Resume.pdf</span>
+    <input type="button" class="dummyUpload" value="Update resume">
+    <input type="file" id="attachCV" style="display:none">
+  </div>
+  <form><input type="text" placeholder="Email"><input type="password"><button type="submit">Login</button></form>
+</body></html>
+""")
+
+COMMANDS = {
+    "find_element_xpath": lambda d: d.find_element(By.XPATH, "//input[@type='file' and @id='attachCV']"),
+    "find_element_id": lambda d: d.find_element(By.ID, "attachCV"),
+    "find_elements_scan": lambda d: d.find_elements(By.XPATH, "//*[contains(text(), 'uploaded')]"),
+    "execute_script": lambda d: d.execute_script("return document.querySelector('input[type=file]');"),
+    "get_attribute": lambda d: d.find_element(By.ID, "attachCV").get_attribute("value"),
+    "current_url": lambda d: d.current_url,
+}
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def benchmark_commands(mode, iterations):
+    results = {}
+
+    start = time.perf_counter()
+    driver = DriverFactory.create_driver(mode)
+    results["session_start"] = [(time.perf_counter() - start) * 1000]
+
+    try:
+        # Missing elements must fail fast so lookups measure round trips, not waits
+        driver.implicitly_wait(0)
+
+        timings = []
+        for _ in range(max(1, iterations // 10)):
+            t = time.perf_counter()
+            driver.get(TEST_PAGE)
+            timings.append((time.perf_counter() - t) * 1000)
+        results["get"] = timings
+
+        for name, command in COMMANDS.items():
+            command(driver)  # warm-up
+            timings = []
+            for _ in range(iterations):
+                t = time.perf_counter()
+                command(driver)
+                timings.append((time.perf_counter() - t) * 1000)
+            results[name] = timings
+    finally:
+        t = time.perf_counter()
+        driver.quit()
+        results["quit"] = [(time.perf_counter() - t) * 1000]
+
+    return results
+
+
+def benchmark_full_run(mode):
+    from workflows.update_resume_flow import UpdateResumeFlow
+
+    start = time.perf_counter()
+    driver = DriverFactory.create_driver(mode)
+    try:
+        # An in-memory checkpoint so every backend does the full run
+        UpdateResumeFlow(checkpoint=Checkpoint(None)).run(driver)
+    finally:
+        driver.quit()
+    return (time.perf_counter() - start) * 1000
+
+
+def print_report(all_results, full_runs):
+    modes = list(all_results)
+    print()
+    print(f"{'command':<22}" + "".join(f"{m + ' p50':>14}{m + ' p95':>14}" for m in modes))
+    print("-" * (22 + 28 * len(modes)))
+
+    names = list(next(iter(all_results.values())))
+    for name in names:
+        row = f"{name:<22}"
+        for mode in modes:
+            samples = all_results[mode][name]
+            row += f"{statistics.median(samples):>12.1f}ms{percentile(samples, 95):>12.1f}ms"
+        print(row)
+
+    print()
+    for mode in modes:
+        total = sum(sum(samples) for samples in all_results[mode].values())
+        print(f"{mode}: total command time {total:.0f} ms")
+    for mode, elapsed in full_runs.items():
+        print(f"{mode}: full UpdateResumeFlow run {elapsed / 1000:.1f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modes", nargs="+", default=["grid", "cdp"], choices=["grid", "local", "cdp"])
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--full-run", action="store_true", help="also time one real UpdateResumeFlow per backend")
+    args = parser.parse_args()
+
+    all_results = {}
+    full_runs = {}
+    for mode in args.modes:
+        logger.info(f"Benchmarking backend: {mode}")
+        all_results[mode] = benchmark_commands(mode, args.iterations)
+        if args.full_run:
+            full_runs[mode] = benchmark_full_run(mode)
+
+    print_report(all_results, full_runs)
+
+
+if __name__ == "__main__":
+    main()
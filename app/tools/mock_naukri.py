@@ -0,0 +1,176 @@
+"""
+A minimal local stand-in for the Naukri pages UpdateResumeFlow touches.
+
+Serves the home page (with a logged-in indicator once the session cookie is
+set), the login form, the profile page with a hidden attachCV file input and
+resume widget, a JSON upload endpoint, and the resume PDF itself. Used by the
+soak harness so the flow can run hundreds of times without hitting Naukri.
+"""
+import html
+import threading
+from datetime import date
+from email import policy
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+SESSION_COOKIE = "mock_nauk_at"
+
+PAGE = """<!DOCTYPE html>
+<html><head><title>{title}</title></head>
+<body>
+{body}
+</body></html>"""
+
+HOME_LOGGED_IN = """
+<div class="nI-gNb-header">
+  <a href="/mnjuser/profile" title="My Naukri">My Naukri</a>
+  <div class="user-name">Mock User</div>
+</div>
+"""
+
+HOME_LOGGED_OUT = """
+<a id="login_Layer" title="Jobseeker Login" href="/nlogin/login">Login</a>
+"""
+
+LOGIN_FORM = """
+<form method="post" action="/nlogin/login">
+  <input type="text" id="usernameField" name="email" placeholder="Enter Email ID / Username">
+  <input type="password" id="passwordField" name="password" placeholder="Enter Password">
+  <button type="submit" class="loginButton">Login</button>
+</form>
+"""
+
+PROFILE = """
+<div class="resume-section" id="resume">
+  <div class="cvContainer">
+    <span class="widgetHead">Resume</span>
+    <div class="truncate exten" title="{file_name}">{file_name}</div>
+    <div class="updateOn">Uploaded on {uploaded_on}</div>
+  </div>
+  <input type="button" class="dummyUpload" value="Update resume"
+         onclick="document.getElementById('attachCV').click()">
+  <input type="file" id="attachCV" name="attachCV" style="display:none">
+  <div id="uploadStatus"></div>
+</div>
+<script>
+document.getElementById('attachCV').addEventListener('change', function(){{
+    if(!this.files.length) return;
+    var data = new FormData();
+    data.append('file', this.files[0]);
+    fetch('/cloudgateway-mynaukri/resman-aggregator-services/v0/users/self/profiles/resume/upload',
+          {{method: 'POST', body: data}})
+        .then(function(r){{ return r.json(); }})
+        .then(function(result){{
+            document.getElementById('uploadStatus').textContent = 'Resume has been successfully uploaded';
+            document.querySelector('.truncate').textContent = result.fileName;
+        }});
+}});
+</script>
+"""
+
+
+class MockNaukriState:
+    def __init__(self, resume_bytes):
+        self.resume_bytes = resume_bytes
+        self.lock = threading.Lock()
+        self.uploads = 0
+        self.logins = 0
+        self.file_name = "Resume.pdf"
+        self.uploaded_on = "Jan 01, 2020"
+
+
+def make_handler(state):
+    class MockNaukriHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _logged_in(self):
+            return f"{SESSION_COOKIE}=" in (self.headers.get("Cookie") or "")
+
+        def _send(self, status, body, content_type="text/html; charset=utf-8", headers=None):
+            payload = body if isinstance(body, bytes) else body.encode()
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _page(self, title, body):
+            self._send(200, PAGE.format(title=title, body=body))
+
+        def do_GET(self):
+            path = self.path.split("?")[0]
+            if path == "/resume.pdf":
+                self._send(200, state.resume_bytes, "application/pdf")
+            elif path == "/nlogin/login":
+                self._page("Login", LOGIN_FORM)
+            elif path.startswith("/mnjuser/profile"):
+                if not self._logged_in():
+                    self._send(302, "", headers={"Location": "/nlogin/login"})
+                    return
+                with state.lock:
+                    body = PROFILE.format(
+                        file_name=html.escape(state.file_name),
+                        uploaded_on=html.escape(state.uploaded_on),
+                    )
+                self._page("Profile", body)
+            elif path.startswith("/mnjuser/homepage") or path == "/":
+                self._page("Home", HOME_LOGGED_IN if self._logged_in() else HOME_LOGGED_OUT)
+            else:
+                self._send(404, "not found", "text/plain")
+
+        def do_POST(self):
+            path = self.path.split("?")[0]
+            length = int(self.headers.get("Content-Length") or 0)
+
+            if path == "/nlogin/login":
+                self.rfile.read(length)
+                with state.lock:
+                    state.logins += 1
+                self._send(302, "", headers={
+                    "Location": "/mnjuser/homepage",
+                    "Set-Cookie": f"{SESSION_COOKIE}=mock-session; Path=/",
+                })
+            elif path.endswith("/resume/upload"):
+                body = self.rfile.read(length)
+                message = BytesParser(policy=policy.default).parsebytes(
+                    f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode() + body
+                )
+                upload_name = next(
+                    (part.get_filename() for part in message.iter_parts() if part.get_filename()), None
+                )
+                with state.lock:
+                    state.uploads += 1
+                    if upload_name:
+                        state.file_name = Path(upload_name).name
+                    state.uploaded_on = date.today().strftime("%b %d, %Y")
+                    file_name = state.file_name
+                self._send(200, f'{{"status": "ok", "fileName": "{file_name}"}}', "application/json")
+            else:
+                self.rfile.read(length)
+                self._send(404, "not found", "text/plain")
+
+    return MockNaukriHandler
+
+
+class MockNaukriServer:
+    """Runs the mock site on a background thread."""
+
+    def __init__(self, resume_path, bind="127.0.0.1", port=0, public_host=None):
+        self.state = MockNaukriState(Path(resume_path).read_bytes())
+        self.httpd = ThreadingHTTPServer((bind, port), make_handler(self.state))
+        self.httpd.daemon_threads = True
+        host = public_host or bind
+        self.base_url = f"http://{host}:{self.httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
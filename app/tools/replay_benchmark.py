@@ -0,0 +1,182 @@
+"""
+Replay a recorded WebDriver session against the current UpdateResumeFlow,
+offline and deterministically, and report command count and simulated
+wall time.
+
+Record a trace from a real run first (grid or local mode):
+
+    RECORD_SESSION_DIR=logs/traces python app/main.py
+
+then replay it, e.g. in CI:
+
+    python app/tools/replay_benchmark.py logs/traces/20261019-091502-3f2a9c1b.json
+    python app/tools/replay_benchmark.py TRACE --latency-scale 0.5
+    python app/tools/replay_benchmark.py TRACE --max-commands 180 --max-seconds 40
+
+Responses come from the trace, each costing its recorded latency times
+--latency-scale. Time is virtual: every sleep, wait poll and command
+latency advances a simulated clock instead of real time, so a replay takes
+seconds and gives the same result on every machine. --real-time sleeps for
+real instead.
+
+Commands the code no longer issues are skipped over; a command issued more
+often than recorded (an extra wait poll) reuses its last response. A
+command that never appears in the trace ends the replay with a mismatch -
+record a new trace after changes that alter what the flow asks the browser.
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import Settings
+from core.checkpoint import Checkpoint
+from core.logger import logger
+from core.session_trace import ReplayDriver, ReplayMismatch, Scrubber, load_trace
+from utils import resume_widget, session_manager
+from workflows import update_resume_flow
+from workflows.update_resume_flow import UpdateResumeFlow
+
+DEFAULT_RESUME = Path(__file__).resolve().parents[2] / "resume_latest.pdf"
+
+# Stand-in credentials; distinctive so scrubbing them cannot touch anything else
+REPLAY_EMAIL = "replay-user@example.invalid"
+REPLAY_PASSWORD = "replay-password-0000"
+
+
+class VirtualClock:
+    """Replaces time.sleep/time/monotonic/perf_counter so waiting costs no real time."""
+
+    def __init__(self):
+        self.offset = 0.0
+        self._real = {name: getattr(time, name) for name in ("sleep", "time", "monotonic", "perf_counter")}
+
+    def install(self):
+        time.sleep = self.sleep
+        for name in ("time", "monotonic", "perf_counter"):
+            real = self._real[name]
+            setattr(time, name, lambda real=real: real() + self.offset)
+
+    def uninstall(self):
+        for name, func in self._real.items():
+            setattr(time, name, func)
+
+    def sleep(self, seconds):
+        self.offset += max(0.0, seconds)
+
+
+def recorded_date(trace):
+    """date with today() fixed to the recording day, so date-dependent decisions replay the same way."""
+    day = date.fromisoformat(trace["meta"]["recorded_on"])
+
+    class RecordedDate(date):
+        @classmethod
+        def today(cls):
+            return day
+
+    return RecordedDate
+
+
+def configure(trace, workdir, resume):
+    """Recreate the recorded run's settings, resume file name and cookie file."""
+    meta = trace["meta"]
+    for name, value in meta["settings"].items():
+        setattr(Settings, name, value)
+    Settings.NAUKRI_EMAIL = REPLAY_EMAIL
+    Settings.NAUKRI_PASSWORD = REPLAY_PASSWORD
+    Settings.NETWORK_UPLOAD_CONFIRM = False
+    Settings.OPTIMIZE_RESUME = False
+    Settings.PROFILE_COMMANDS = False
+    Settings.RECORD_SESSION_DIR = ""
+    # Learned timeouts differ per machine; replays use the fixed defaults
+    Settings.ADAPTIVE_TIMEOUTS = False
+
+    resume_path = workdir / meta["resume_name"]
+    shutil.copyfile(resume, resume_path)
+    Settings.RESUME_TEMP_PATH = str(resume_path)
+    update_resume_flow.download_resume = lambda url=None, output_path=None: str(resume_path)
+
+    # Whether today's resume is already on the profile depends on the day
+    update_resume_flow.date = resume_widget.date = recorded_date(trace)
+
+    # The recorded run loaded whatever cookies it had; load the same (scrubbed) ones
+    session_manager.COOKIE_FILE = workdir / "cookies.json"
+    cookies = [e["params"]["cookie"] for e in trace["entries"] if e["command"] == "addCookie"]
+    if cookies:
+        with open(session_manager.COOKIE_FILE, "w") as f:
+            json.dump(cookies, f)
+
+
+def recorded_duration(trace):
+    last = trace["entries"][-1]
+    return (last["t"] + last["ms"]) / 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("trace", help="trace file written with RECORD_SESSION_DIR")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="multiplier for recorded command latencies")
+    parser.add_argument("--resume", default=str(DEFAULT_RESUME), help="PDF used as the downloaded resume")
+    parser.add_argument("--real-time", action="store_true", help="sleep for real instead of on a virtual clock")
+    parser.add_argument("--max-commands", type=int, help="fail if the replay issues more commands")
+    parser.add_argument("--max-seconds", type=float, help="fail if simulated wall time is longer")
+    args = parser.parse_args()
+
+    trace = load_trace(args.trace)
+    workdir = Path(tempfile.mkdtemp(prefix="naukri-replay-"))
+    configure(trace, workdir, args.resume)
+
+    clock = VirtualClock()
+    if not args.real_time:
+        clock.install()
+
+    error = None
+    start = time.perf_counter()
+    driver = ReplayDriver(trace, Scrubber.from_settings(), args.latency_scale)
+    try:
+        UpdateResumeFlow(checkpoint=Checkpoint(None)).run(driver)
+    except Exception as e:
+        error = e
+    finally:
+        try:
+            driver.quit()
+        except ReplayMismatch:
+            pass
+        elapsed = time.perf_counter() - start
+        clock.uninstall()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    replay = driver.replay
+    recorded = len(trace["entries"])
+    print()
+    print(f"{'':<22}{'recorded':>12}{'replayed':>12}")
+    print("-" * 46)
+    print(f"{'commands':<22}{recorded:>12}{replay.served:>12}")
+    print(f"{'wall time (s)':<22}{recorded_duration(trace):>12.1f}{elapsed:>12.1f}")
+    print(f"{'command time (s)':<22}{sum(e['ms'] for e in trace['entries']) / 1000:>12.1f}{replay.latency_s:>12.1f}")
+    print()
+    print(f"skipped recorded commands: {replay.skipped}, reused responses: {replay.reused}")
+
+    problems = []
+    if error:
+        problems.append(f"replay failed: {error}")
+    if args.max_commands is not None and replay.served > args.max_commands:
+        problems.append(f"{replay.served} commands (limit {args.max_commands})")
+    if args.max_seconds is not None and elapsed > args.max_seconds:
+        problems.append(f"{elapsed:.1f} s simulated (limit {args.max_seconds} s)")
+
+    if problems:
+        for problem in problems:
+            logger.error(f"❌ {problem}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""
+Soak test: run UpdateResumeFlow many times against a local mock of the
+Naukri pages and fail if memory, file descriptors, browser sessions or
+latency keep growing.
+
+Run from the project root inside the app container, e.g.:
+
+    python app/tools/soak_test.py --runs 200 --mode local
+    python app/tools/soak_test.py --runs 300 --concurrency 4 --mode local
+    python app/tools/soak_test.py --runs 100 --mode grid --bind 0.0.0.0 --public-host app
+
+Each run creates a driver with DriverFactory, runs the full flow with an
+in-memory checkpoint and quits the driver, exactly as main.py does. After
+every run the harness samples:
+
+    app RSS         VmRSS of this process
+    open fds        entries in /proc/self/fd
+    live sessions   browser sessions still open (Grid /status slots, or
+                    top-level Chrome processes for local/cdp)
+    chrome RSS      summed RSS of all Chrome processes visible to us
+    latency         wall time of the run
+
+A metric fails when the median of the last quarter of samples exceeds the
+median of the first quarter (after warm-up) by more than its threshold.
+Sessions still open after all runs have quit, beyond the baseline, are
+always a failure. The exit code is 1 on any failure.
+
+In grid mode the browser runs in the selenium container, so the mock site
+must listen on an address it can reach (--bind 0.0.0.0 --public-host app)
+and Chrome memory is not visible from here.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+from config.accounts import Account
+from config.settings import Settings
+from core.checkpoint import Checkpoint
+from core.driver_factory import DriverFactory
+from core.logger import logger
+from tools.mock_naukri import MockNaukriServer
+from utils import session_manager
+from workflows import update_resume_flow
+from workflows.update_resume_flow import UpdateResumeFlow
+
+GRID_STATUS_URL = f"{Settings.SELENIUM_URL}/status"
+DEFAULT_RESUME = Path(__file__).resolve().parents[2] / "resume_latest.pdf"
+
+
+class ScaledTime:
+    """Stands in for the time module in the flow so its fixed sleeps can be shortened."""
+
+    def __init__(self, scale):
+        self.scale = scale
+
+    def sleep(self, seconds):
+        time.sleep(seconds * self.scale)
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+# ------------------------------------------------------------
+# RESOURCE SAMPLING
+# ------------------------------------------------------------
+
+def _proc_status_kb(pid, field):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def _chrome_processes():
+    """Yield (pid, cmdline) for every Chrome/Chromium process visible in /proc."""
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/comm") as f:
+                name = f.read().strip()
+            if not name.startswith("chrom") or name == "chromedriver":
+                continue
+            with open(f"/proc/{entry}/cmdline", "rb") as f:
+                cmdline = f.read().decode(errors="replace").split("\0")
+        except OSError:
+            continue
+        yield int(entry), cmdline
+
+
+def app_rss_mb():
+    return _proc_status_kb("self", "VmRSS") / 1024
+
+
+def open_fds():
+    return len(os.listdir("/proc/self/fd"))
+
+
+def chrome_rss_mb():
+    return sum(_proc_status_kb(pid, "VmRSS") for pid, _ in _chrome_processes()) / 1024
+
+
+def live_sessions(mode):
+    if mode == "grid":
+        try:
+            status = requests.get(GRID_STATUS_URL, timeout=5).json()["value"]
+            return sum(
+                1
+                for node in status.get("nodes", [])
+                for slot in node.get("slots", [])
+                if slot.get("session")
+            )
+        except Exception as e:
+            logger.warning(f"Could not read Grid status: {e}")
+            return 0
+
+    # One browser process per session; renderers, GPU and utility
+    # processes carry a --type= switch
+    return sum(
+        1
+        for _, cmdline in _chrome_processes()
+        if not any(arg.startswith("--type=") for arg in cmdline)
+        and any(arg.startswith("--user-data-dir") for arg in cmdline)
+    )
+
+
+def sample(mode):
+    return {
+        "app_rss_mb": app_rss_mb(),
+        "open_fds": open_fds(),
+        "live_sessions": live_sessions(mode),
+        "chrome_rss_mb": chrome_rss_mb(),
+    }
+
+
+# ------------------------------------------------------------
+# SOAK
+# ------------------------------------------------------------
+
+def configure(server, workdir, sleep_scale):
+    """Point the flow at the mock site and keep its state out of the real project files."""
+    Settings.BASE_URL = server.base_url
+    Settings.LOGIN_URL = f"{server.base_url}/nlogin/login"
+    Settings.NAUKRI_PROFILE_URL = f"{server.base_url}/mnjuser/profile"
+    Settings.GITHUB_RESUME_URL = f"{server.base_url}/resume.pdf"
+    Settings.RESUME_TEMP_PATH = str(workdir / "Soak_Resume.pdf")
+    Settings.NETWORK_UPLOAD_CONFIRM = False
+    Settings.PROFILE_COMMANDS = False
+    # The mock shows today's upload after the first run; every run should upload
+    Settings.SKIP_UPLOAD_IF_CURRENT = False
+    # A persistent profile can only be used by one browser at a time
+    Settings.CHROME_PROFILE_DIR = ""
+    # Learned timeouts would shrink run over run and mask latency drift
+    Settings.ADAPTIVE_TIMEOUTS = False
+    session_manager.COOKIE_FILE = workdir / "cookies.json"
+    update_resume_flow.time = ScaledTime(sleep_scale)
+
+
+def worker_account(workdir):
+    """
+    The settings' account with resume and cookie files private to the
+    calling thread, so concurrent runs don't overwrite each other's files
+    while sequential runs still reuse their cookies like real ones.
+    """
+    worker_dir = workdir / threading.current_thread().name
+    account = Account.from_settings()
+    account.cookie_file = str(worker_dir / "cookies.json")
+    account.resume_path = str(worker_dir / Path(Settings.RESUME_TEMP_PATH).name)
+    return account
+
+
+def run_once(mode, workdir):
+    start = time.perf_counter()
+    driver = DriverFactory.create_driver(mode)
+    try:
+        UpdateResumeFlow(checkpoint=Checkpoint(None), account=worker_account(workdir)).run(driver)
+    finally:
+        driver.quit()
+    return time.perf_counter() - start
+
+
+def soak(mode, runs, concurrency, workdir):
+    samples = []
+    failures = []
+    lock = threading.Lock()
+
+    def one(index):
+        try:
+            latency = run_once(mode, workdir)
+        except Exception as e:
+            with lock:
+                failures.append((index, str(e)))
+            logger.error(f"Soak run {index} failed: {e}")
+            return
+        snapshot = sample(mode)
+        snapshot["latency_s"] = latency
+        with lock:
+            samples.append(snapshot)
+            done = len(samples) + len(failures)
+        logger.info(
+            f"[{done}/{runs}] {latency:.1f} s | app {snapshot['app_rss_mb']:.0f} MB | "
+            f"fds {snapshot['open_fds']} | sessions {snapshot['live_sessions']} | "
+            f"chrome {snapshot['chrome_rss_mb']:.0f} MB"
+        )
+
+    if concurrency <= 1:
+        for index in range(runs):
+            one(index)
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(one, range(runs)))
+
+    return samples, failures
+
+
+def growth(values, warmup):
+    """Median of the last quarter minus median of the first quarter, after warm-up."""
+    values = values[warmup:]
+    quarter = len(values) // 4
+    if quarter < 1:
+        return None, None, None
+    first = statistics.median(values[:quarter])
+    last = statistics.median(values[-quarter:])
+    return first, last, last - first
+
+
+def evaluate(samples, baseline, final, args):
+    limits = {
+        "app_rss_mb": ("MB", args.max_rss_growth_mb),
+        "open_fds": ("", args.max_fd_growth),
+        "chrome_rss_mb": ("MB", args.max_chrome_growth_mb),
+    }
+
+    problems = []
+    print()
+    print(f"{'metric':<16}{'first':>12}{'last':>12}{'growth':>12}{'limit':>12}")
+    print("-" * 64)
+    for name, (unit, limit) in limits.items():
+        first, last, delta = growth([s[name] for s in samples], args.warmup)
+        if delta is None:
+            continue
+        print(f"{name:<16}{first:>12.1f}{last:>12.1f}{delta:>12.1f}{limit:>10}{unit:>2}")
+        if delta > limit:
+            problems.append(f"{name} grew by {delta:.1f}{unit} (limit {limit}{unit})")
+
+    first, last, _ = growth([s["latency_s"] for s in samples], args.warmup)
+    if first:
+        drift = last / first
+        print(f"{'latency_s':<16}{first:>12.2f}{last:>12.2f}{drift:>11.2f}x{args.max_latency_drift:>11}x")
+        if drift > args.max_latency_drift:
+            problems.append(f"latency drifted {drift:.2f}x (limit {args.max_latency_drift}x)")
+
+    leaked = final["live_sessions"] - baseline["live_sessions"]
+    print(f"{'leaked sessions':<16}{baseline['live_sessions']:>12}{final['live_sessions']:>12}{leaked:>12}{0:>12}")
+    if leaked > 0:
+        problems.append(f"{leaked} browser session(s) still open after all runs quit")
+
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--mode", default=Settings.DRIVER_MODE, choices=["grid", "local", "cdp"])
+    parser.add_argument("--resume", default=str(DEFAULT_RESUME), help="PDF served as the resume")
+    parser.add_argument("--bind", default="127.0.0.1", help="address the mock site listens on")
+    parser.add_argument("--public-host", help="host name the browser uses to reach the mock site")
+    parser.add_argument("--sleep-scale", type=float, default=0.1, help="multiplier for the flow's fixed sleeps")
+    parser.add_argument("--warmup", type=int, default=5, help="runs excluded from growth checks")
+    parser.add_argument("--max-rss-growth-mb", type=float, default=50)
+    parser.add_argument("--max-fd-growth", type=float, default=20)
+    parser.add_argument("--max-chrome-growth-mb", type=float, default=200)
+    parser.add_argument("--max-latency-drift", type=float, default=1.5)
+    args = parser.parse_args()
+
+    server = MockNaukriServer(args.resume, bind=args.bind, public_host=args.public_host).start()
+    workdir = Path(tempfile.mkdtemp(prefix="naukri-soak-"))
+    configure(server, workdir, args.sleep_scale)
+    logger.info(f"Mock Naukri running at {server.base_url}")
+
+    baseline = sample(args.mode)
+    try:
+        samples, failures = soak(args.mode, args.runs, args.concurrency, workdir)
+    finally:
+        server.stop()
+
+    # Give Chrome and the Grid a moment to reap sessions that were quit last
+    time.sleep(5)
+    final = sample(args.mode)
+
+    problems = evaluate(samples, baseline, final, args)
+    if failures:
+        problems.append(f"{len(failures)}/{args.runs} runs failed")
+    print()
+    print(f"mock site: {server.state.logins} logins, {server.state.uploads} uploads")
+
+    if problems:
+        for problem in problems:
+            logger.error(f"❌ {problem}")
+        sys.exit(1)
+    logger.info("✅ No unbounded growth detected")
+
+
+if __name__ == "__main__":
+    main()
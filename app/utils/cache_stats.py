@@ -0,0 +1,46 @@
+from core.logger import logger
+from core.metrics import metrics
+
+# Resource Timing: a response served from the HTTP cache transfers no bytes,
+# a revalidated one (304) transfers only headers. Entries without a decoded
+# body (opaque cross-origin responses) carry no information and are skipped.
+CACHE_STATS_JS = """
+var entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+var stats = {resources: 0, hits: 0, bytes_saved: 0, bytes_transferred: 0};
+for (var i = 0; i < entries.length; i++) {
+    var e = entries[i];
+    if (!e.decodedBodySize) continue;
+    stats.resources += 1;
+    stats.bytes_transferred += e.transferSize;
+    if (e.transferSize === 0 || e.transferSize < e.encodedBodySize) {
+        stats.hits += 1;
+        stats.bytes_saved += Math.max(0, e.encodedBodySize - e.transferSize);
+    }
+}
+return stats;
+"""
+
+
+def record_cache_stats(driver, page):
+    """Add the current page's HTTP cache hits and bytes saved to the run metrics."""
+    try:
+        stats = driver.execute_script(CACHE_STATS_JS)
+    except Exception as e:
+        logger.debug(f"Could not read resource timing on {page}: {e}")
+        return
+
+    if not stats or not stats["resources"]:
+        return
+
+    metrics.increment("cache_resources", stats["resources"])
+    metrics.increment("cache_hits", stats["hits"])
+    metrics.increment("cache_bytes_saved", stats["bytes_saved"])
+    metrics.increment("cache_bytes_transferred", stats["bytes_transferred"])
+    metrics.record(
+        "cache_hit_ratio",
+        round(metrics.get("cache_hits") / metrics.get("cache_resources"), 3),
+    )
+    logger.info(
+        f"{page}: {stats['hits']}/{stats['resources']} resources from cache, "
+        f"{stats['bytes_saved'] // 1024} KB saved"
+    )
@@ -0,0 +1,199 @@
+import time
+
+from selenium.webdriver.common.by import By
+
+from core.logger import logger
+
+# Single-pass query engine installed in the page as window.__naukriDeepQuery.
+#
+# Walks the document once with a TreeWalker, descending into open shadow
+# roots and same-origin frames as it meets them, and tests every element
+# against all CSS queries in that one pass. XPath queries are evaluated once
+# per document. Each match carries the window.frames index path from the
+# top document to its frame.
+DEEP_QUERY_JS = r"""
+(function(){
+    if(window.__naukriDeepQuery) return;
+
+    function frameIndex(win){
+        var parent = win.parent;
+        for(var i = 0; i < parent.frames.length; i++){
+            if(parent.frames[i] === win) return i;
+        }
+        return -1;
+    }
+
+    function usable(el, clickable){
+        if(!clickable) return true;
+        if(el.disabled) return false;
+        var style = el.ownerDocument.defaultView.getComputedStyle(el);
+        if(style.visibility === 'hidden' || style.display === 'none') return false;
+        var rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0;
+    }
+
+    window.__naukriDeepQuery = function(queries, firstOnly, clickable){
+        var results = queries.map(function(){ return []; });
+        var cssIndexes = [], xpathIndexes = [];
+        queries.forEach(function(q, i){ (q.xpath ? xpathIndexes : cssIndexes).push(i); });
+
+        var documents = [];
+        var stack = [{root: document, path: []}];
+        while(stack.length){
+            var entry = stack.pop();
+            if(entry.root.nodeType === 9) documents.push(entry);
+
+            var doc = entry.root.ownerDocument || entry.root;
+            var walker = doc.createTreeWalker(entry.root, NodeFilter.SHOW_ELEMENT);
+            for(var node = walker.nextNode(); node; node = walker.nextNode()){
+                for(var c = 0; c < cssIndexes.length; c++){
+                    var qi = cssIndexes[c];
+                    try{
+                        if(node.matches(queries[qi].css) && usable(node, clickable)){
+                            results[qi].push({element: node, path: entry.path});
+                        }
+                    }catch(e){}
+                }
+                if(node.shadowRoot){
+                    stack.push({root: node.shadowRoot, path: entry.path});
+                }
+                if(node.tagName === 'IFRAME' || node.tagName === 'FRAME'){
+                    try{
+                        if(node.contentDocument){
+                            stack.push({
+                                root: node.contentDocument,
+                                path: entry.path.concat([frameIndex(node.contentWindow)])
+                            });
+                        }
+                    }catch(e){ /* cross-origin */ }
+                }
+            }
+            // Highest-priority query already satisfied - nothing can outrank it
+            if(firstOnly && cssIndexes[0] === 0 && results[0].length) break;
+        }
+
+        for(var x = 0; x < xpathIndexes.length; x++){
+            var xi = xpathIndexes[x];
+            for(var d = 0; d < documents.length; d++){
+                try{
+                    var snapshot = documents[d].root.evaluate(
+                        queries[xi].xpath, documents[d].root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                    for(var s = 0; s < snapshot.snapshotLength; s++){
+                        var el = snapshot.snapshotItem(s);
+                        if(el.nodeType === 1 && usable(el, clickable)){
+                            results[xi].push({element: el, path: documents[d].path});
+                        }
+                    }
+                }catch(e){}
+            }
+        }
+
+        var matches = [];
+        for(var r = 0; r < results.length; r++){
+            for(var m = 0; m < results[r].length; m++){
+                var match = results[r][m];
+                matches.push({element: match.element, path: match.path, query: r});
+                if(firstOnly) return matches;
+            }
+        }
+        return matches;
+    };
+})();
+"""
+
+CALL_JS = """
+if(!window.__naukriDeepQuery) return '__not_installed__';
+return window.__naukriDeepQuery(arguments[0], arguments[1], arguments[2]);
+"""
+
+
+def _to_queries(locators):
+    """Convert Selenium (By, value) locators into engine queries."""
+    queries = []
+    for by, value in locators:
+        if by == By.XPATH:
+            queries.append({"xpath": value})
+        elif by == By.ID:
+            queries.append({"css": f'[id="{value}"]'})
+        elif by == By.NAME:
+            queries.append({"css": f'[name="{value}"]'})
+        elif by == By.CLASS_NAME:
+            queries.append({"css": f".{value}"})
+        elif by in (By.CSS_SELECTOR, By.TAG_NAME):
+            queries.append({"css": value})
+        else:
+            raise ValueError(f"Locator strategy not supported by deep query: {by}")
+    return queries
+
+
+def register_deep_query(driver):
+    """
+    Install the engine once per session.
+
+    Drivers with CDP access register it for every new document, so later
+    calls only ship the query. Otherwise it is installed lazily the first
+    time a page is found without it.
+    """
+    if driver.__dict__.get("_deep_query_registered"):
+        return
+    driver.__dict__["_deep_query_registered"] = True
+
+    if hasattr(driver, "execute_cdp_cmd"):
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": DEEP_QUERY_JS})
+        except Exception as e:
+            logger.debug(f"Could not register deep query for new documents: {e}")
+    driver.execute_script(DEEP_QUERY_JS)
+
+
+def deep_query(driver, locators, first_only=True, clickable=False):
+    """
+    Run locators (in priority order) across the document, open shadow roots
+    and same-origin frames in one call. Returns a list of (element, frame_path).
+    """
+    register_deep_query(driver)
+    args = (_to_queries(locators), first_only, clickable)
+
+    matches = driver.execute_script(CALL_JS, *args)
+    if matches == "__not_installed__":
+        # A navigation replaced the document since the engine was installed
+        driver.execute_script(DEEP_QUERY_JS)
+        matches = driver.execute_script(CALL_JS, *args)
+
+    return [(m["element"], list(m["path"])) for m in matches or []]
+
+
+def switch_to_frame_path(driver, path):
+    driver.switch_to.default_content()
+    for index in path:
+        driver.switch_to.frame(index)
+
+
+def deep_find(driver, locators, timeout=0, clickable=False, poll_interval=0.25):
+    """
+    Poll deep_query until a locator matches or the timeout expires.
+
+    Returns (element, frame_path), or (None, None). Elements inside a frame
+    are re-resolved from within that frame so the returned reference is
+    valid after switch_to_frame_path(driver, frame_path). The driver is
+    always left on the top-level document.
+    """
+    deadline = time.time() + timeout
+    while True:
+        matches = deep_query(driver, locators, first_only=True, clickable=clickable)
+        if matches:
+            element, path = matches[0]
+            if not path:
+                return element, path
+
+            switch_to_frame_path(driver, path)
+            try:
+                local = deep_query(driver, locators, first_only=True, clickable=clickable)
+            finally:
+                driver.switch_to.default_content()
+            if local:
+                return local[0][0], path
+
+        if time.time() >= deadline:
+            return None, None
+        time.sleep(poll_interval)
@@ -0,0 +1,68 @@
+import os
+import time
+import zipfile
+from base64 import b64encode
+from io import BytesIO
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.file_detector import UselessFileDetector
+
+from core.logger import logger
+from core.metrics import metrics
+from utils.file_hash import file_sha256
+
+
+def stage_file(driver, path) -> str:
+    """
+    Copy a local file to the browser node once per session and return its remote path.
+
+    Remote paths are cached on the driver keyed by content hash, so retries
+    and repeated send_keys calls reuse the copy instead of re-shipping the
+    bytes through the Grid. Local (non-remote) drivers get the path back as-is.
+    """
+    if not getattr(driver, "_is_remote", False):
+        return path
+
+    staged = driver.__dict__.setdefault("_staged_files", {})
+    digest = file_sha256(path)
+    if digest in staged:
+        logger.info("✓ Reusing resume already transferred to the browser node")
+        metrics.increment("file_transfer_reused")
+        return staged[digest]
+
+    fp = BytesIO()
+    with zipfile.ZipFile(fp, "w", zipfile.ZIP_DEFLATED) as zipped:
+        zipped.write(path, os.path.basename(path))
+    content = b64encode(fp.getvalue()).decode("ascii")
+
+    start = time.perf_counter()
+    try:
+        remote_path = driver.execute(Command.UPLOAD_FILE, {"file": content})["value"]
+    except WebDriverException as e:
+        # Same fallback as Selenium: nodes without the upload endpoint share our filesystem
+        if "Unrecognized command" in str(e) or "Command not found" in str(e):
+            logger.warning("Browser node does not support file upload - using local path")
+            return path
+        raise
+    elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+
+    metrics.increment("file_transfer_count")
+    metrics.increment("file_transfer_bytes", len(content))
+    metrics.increment("file_transfer_ms", elapsed_ms)
+    logger.info(f"✓ Transferred resume to browser node ({len(content)} bytes in {elapsed_ms} ms)")
+
+    staged[digest] = remote_path
+    return remote_path
+
+
+def send_file(driver, element, path):
+    """Set a file input to a local file, transferring it to the node only if needed."""
+    remote_path = stage_file(driver, path)
+    if remote_path == path:
+        element.send_keys(path)
+        return
+
+    # The path now refers to the node's filesystem; stop Selenium from re-uploading it
+    with driver.file_detector_context(UselessFileDetector):
+        element.send_keys(remote_path)
@@ -0,0 +1,108 @@
+from core.logger import logger
+from core.metrics import metrics
+
+# Fills every field and submits in one script execution.
+#
+# Values go through the prototype's native value setter so framework-managed
+# inputs (React keeps its own value tracker on the element) see a real change,
+# followed by the input/change/blur events a user's typing would produce. A
+# field whose value did not stick, or that the page marks invalid, is reported
+# back instead of submitting so the caller can type into it instead.
+#
+# Arguments are flat (submit, values, ...fields) because not every backend
+# serialises elements nested inside arrays.
+FILL_AND_SUBMIT_JS = """
+var submit = arguments[0], values = arguments[1];
+var fields = Array.prototype.slice.call(arguments, 2);
+var rejected = [];
+for(var i = 0; i < fields.length; i++){
+    var el = fields[i];
+    var proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    el.focus();
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, values[i]);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    el.blur();
+    if(el.value !== values[i] || (el.checkValidity && !el.checkValidity())) rejected.push(i);
+}
+if(rejected.length) return {rejected: rejected, submitted: null};
+return {rejected: rejected, submitted: submitNow(submit, fields)};
+
+function submitNow(submit, fields){
+    if(submit && !submit.disabled){
+        submit.click();
+        return 'button';
+    }
+    var form = fields.length ? fields[fields.length - 1].form : null;
+    if(form){
+        if(form.requestSubmit) form.requestSubmit(); else form.submit();
+        return 'form';
+    }
+    return null;
+}
+"""
+
+# Small element interactions that would otherwise be one round trip each
+ELEMENT_ACTIONS_JS = """
+var el = arguments[0], actions = arguments[1], result = {};
+for(var i = 0; i < actions.length; i++){
+    switch(actions[i]){
+        case 'reveal':
+            el.style.display = 'block';
+            el.style.visibility = 'visible';
+            el.style.opacity = '1';
+            el.style.position = 'static';
+            el.style.height = 'auto';
+            el.style.width = 'auto';
+            break;
+        case 'focus': el.focus(); break;
+        case 'input': el.dispatchEvent(new Event('input', {bubbles: true})); break;
+        case 'change': el.dispatchEvent(new Event('change', {bubbles: true})); break;
+        case 'click': el.click(); break;
+        case 'value': result.value = el.value; break;
+        default: throw new Error('Unknown element action: ' + actions[i]);
+    }
+}
+return result;
+"""
+
+
+def fill_and_submit(driver, fields, submit=None):
+    """
+    Set each (element, value) in fields and submit, in one round trip.
+
+    submit is clicked if given and enabled, otherwise the form owning the
+    last field is submitted. Fields the page rejects are typed key by key
+    and the form submitted with a plain click. Returns how the form was
+    submitted ('button', 'form' or 'keystrokes'), or None when there was
+    nothing to submit with, which leaves submitting to the caller.
+    """
+    elements = [element for element, _ in fields]
+    values = [value for _, value in fields]
+    result = driver.execute_script(FILL_AND_SUBMIT_JS, submit, values, *elements)
+
+    rejected = result["rejected"]
+    if not rejected:
+        metrics.increment("form_batched_fills")
+        return result["submitted"]
+
+    logger.warning(f"Page rejected programmatic input for {len(rejected)} field(s) - typing instead")
+    metrics.increment("form_keystroke_fallbacks")
+    for index in rejected:
+        element, value = fields[index]
+        element.clear()
+        element.send_keys(value)
+
+    if submit is None:
+        return None
+    submit.click()
+    return "keystrokes"
+
+
+def perform(driver, element, *actions):
+    """
+    Run element actions ('reveal', 'focus', 'input', 'change', 'click',
+    'value') in order in one script call. Returns {"value": ...} if 'value'
+    was requested, else {}.
+    """
+    return driver.execute_script(ELEMENT_ACTIONS_JS, element, list(actions)) or {}
@@ -1,17 +1,19 @@
+import os
 import requests
 from config.settings import Settings
 from core.logger import logger
 
-def download_resume():
+def download_resume(url=None, output_path=None):
     """
     Downloads resume from GitHub using a raw file URL.
-    Saves it locally as defined in Settings.RESUME_TEMP_PATH.
+    Saves it locally as defined in Settings.RESUME_TEMP_PATH, unless an
+    account-specific url and output_path are given.
     
     GitHub URL format: https://raw.githubusercontent.com/username/repo/branch/path/to/resume.pdf
     """
 
-    url = Settings.GITHUB_RESUME_URL
-    output_path = Settings.RESUME_TEMP_PATH
+    url = url or Settings.GITHUB_RESUME_URL
+    output_path = output_path or Settings.RESUME_TEMP_PATH
 
     try:
         logger.info(f"Downloading resume from GitHub: {url}")
@@ -26,6 +28,8 @@ def download_resume():
         response = requests.get(url, headers=headers, timeout=30)
         response.raise_for_status()
 
+        if os.path.dirname(output_path):
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
         with open(output_path, "wb") as f:
             f.write(response.content)
 
@@ -0,0 +1,133 @@
+import hashlib
+import os
+import re
+import shutil
+from pathlib import Path
+
+from config.settings import Settings
+from core.logger import logger
+from core.metrics import metrics
+from utils.file_hash import file_sha256
+
+FONT_FILE_KEYS = ("/FontFile", "/FontFile2", "/FontFile3")
+
+
+def _extract_text(path) -> list:
+    """Return the normalised text of every page, used to prove the rewrite is lossless."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(str(path))
+    return [re.sub(r"\s+", " ", page.extract_text() or "").strip() for page in reader.pages]
+
+
+def _dedupe_font_files(pdf) -> int:
+    """Point font descriptors that embed byte-identical font programs at one shared stream."""
+    import pikepdf
+
+    seen = {}
+    deduped = 0
+    for obj in pdf.objects:
+        if not isinstance(obj, pikepdf.Dictionary) or obj.get("/Type") != pikepdf.Name.FontDescriptor:
+            continue
+        for key in FONT_FILE_KEYS:
+            stream = obj.get(key)
+            if not isinstance(stream, pikepdf.Stream):
+                continue
+            digest = hashlib.sha256(
+                stream.read_raw_bytes()
+                + repr(stream.get("/Filter")).encode()
+                + repr(stream.get("/Subtype")).encode()
+            ).hexdigest()
+            original = seen.setdefault(digest, stream)
+            if original.objgen != stream.objgen:
+                obj[key] = original
+                deduped += 1
+    return deduped
+
+
+def _rewrite_pdf(source, target, strip_metadata):
+    import pikepdf
+
+    with pikepdf.open(source) as pdf:
+        deduped = _dedupe_font_files(pdf)
+        pdf.remove_unreferenced_resources()
+
+        if strip_metadata:
+            if "/Metadata" in pdf.Root:
+                del pdf.Root.Metadata
+            for key in list(pdf.docinfo.keys()):
+                del pdf.docinfo[key]
+
+        # qpdf only writes reachable objects, so orphaned fonts/images are dropped here
+        pdf.save(
+            target,
+            compress_streams=True,
+            recompress_flate=True,
+            object_stream_mode=pikepdf.ObjectStreamMode.generate,
+        )
+
+    logger.info(f"Rewrote PDF ({deduped} duplicate font program(s) merged)")
+
+
+def optimize_resume(resume_path) -> str:
+    """
+    Losslessly shrink the resume PDF before upload.
+
+    The optimised file is cached under RESUME_CACHE_DIR keyed by the source
+    hash, so repeated runs with the same resume do no work. The original
+    file name is kept because the upload verification looks for it on the
+    profile page. Any failure falls back to the original file.
+    """
+    resume_path = Path(resume_path)
+    original_size = resume_path.stat().st_size
+    metrics.record("resume_bytes_original", original_size)
+
+    source_hash = file_sha256(resume_path)
+    cache_key = source_hash[:16] + ("-nometa" if Settings.STRIP_PDF_METADATA else "")
+    cache_path = Path(Settings.RESUME_CACHE_DIR) / cache_key / resume_path.name
+
+    if cache_path.exists():
+        logger.info(f"✓ Using cached optimised resume: {cache_path}")
+        metrics.record("resume_optimize_cache_hit", True)
+        metrics.record("resume_bytes_upload", cache_path.stat().st_size)
+        return str(cache_path)
+
+    metrics.record("resume_optimize_cache_hit", False)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+
+    try:
+        with metrics.timer("resume_optimize_ms"):
+            _rewrite_pdf(resume_path, tmp_path, Settings.STRIP_PDF_METADATA)
+
+            # The rewrite must still parse and carry exactly the same text
+            if _extract_text(tmp_path) != _extract_text(resume_path):
+                raise ValueError("text content changed after optimisation")
+
+        optimised_size = tmp_path.stat().st_size
+        if optimised_size < original_size:
+            os.replace(tmp_path, cache_path)
+            saved = original_size - optimised_size
+            logger.info(
+                f"✓ Optimised resume: {original_size} → {optimised_size} bytes "
+                f"({saved * 100 // original_size}% smaller)"
+            )
+        else:
+            # Cache the original so the next run does not retry a pointless rewrite;
+            # through the temp file so an interrupted copy is never a cache hit
+            shutil.copyfile(resume_path, tmp_path)
+            os.replace(tmp_path, cache_path)
+            logger.info("Optimisation did not reduce resume size - using original bytes")
+
+        metrics.record("resume_bytes_upload", cache_path.stat().st_size)
+        return str(cache_path)
+
+    except ImportError as e:
+        logger.warning(f"Resume optimisation skipped, missing dependency: {e}")
+    except Exception as e:
+        logger.warning(f"Resume optimisation failed, uploading original: {e}")
+
+    if tmp_path.exists():
+        tmp_path.unlink()
+    metrics.record("resume_bytes_upload", original_size)
+    return str(resume_path)
@@ -0,0 +1,77 @@
+import re
+from datetime import date, datetime, timedelta
+
+from core.logger import logger
+
+# Reads the profile's resume widget in one round trip: the attached file's
+# name and its "Uploaded on ..." text. The widget is searched for first so
+# a file name elsewhere on the page (e.g. in a job card) is not picked up.
+RESUME_WIDGET_JS = r"""
+var roots = document.querySelectorAll(
+    '#resume, .resume-section, .cvContainer, [class*="resume"], [id*="resume"]');
+if(!roots.length) roots = [document.body];
+
+var fileRe = /\S+\.(pdf|docx?|rtf)\b/i;
+var dateRe = /uploaded\s+on\s*:?\s*(.+)/i;
+for(var r = 0; r < roots.length; r++){
+    var fileName = null, uploadedOn = null;
+    var walker = document.createTreeWalker(roots[r], NodeFilter.SHOW_ELEMENT);
+    for(var el = roots[r]; el; el = walker.nextNode()){
+        if(el.children.length) continue;
+        var text = (el.textContent || '').trim();
+        var title = el.getAttribute('title') || '';
+        if(!fileName){
+            var fileMatch = fileRe.exec(title) || fileRe.exec(text);
+            if(fileMatch) fileName = fileMatch[0];
+        }
+        if(!uploadedOn){
+            var dateMatch = dateRe.exec(text);
+            if(dateMatch) uploadedOn = dateMatch[1].trim();
+        }
+    }
+    if(fileName || uploadedOn) return {fileName: fileName, uploadedOn: uploadedOn};
+}
+return null;
+"""
+
+UPLOAD_DATE_FORMATS = ("%b %d, %Y", "%b %d %Y", "%d %b %Y", "%d %b, %Y", "%B %d, %Y", "%d %B %Y", "%d/%m/%Y")
+
+
+def parse_upload_date(text):
+    """Turn the widget's upload date ("Oct 19, 2026", "19 Oct 2026", "Today") into a date."""
+    if not text:
+        return None
+    text = re.sub(r"\s+", " ", text).strip().rstrip(".")
+    lowered = text.lower()
+    if lowered.startswith("today"):
+        return date.today()
+    if lowered.startswith("yesterday"):
+        return date.today() - timedelta(days=1)
+
+    for fmt in UPLOAD_DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def normalize_file_name(name):
+    """Compare file names the way the widget displays them: case, spaces and separators vary."""
+    return re.sub(r"[^a-z0-9]", "", (name or "").lower())
+
+
+def read_resume_widget(driver):
+    """Return {"file_name", "uploaded_on"} for the resume currently on the profile, or None."""
+    try:
+        widget = driver.execute_script(RESUME_WIDGET_JS)
+    except Exception as e:
+        logger.debug(f"Could not read resume widget: {e}")
+        return None
+
+    if not widget:
+        return None
+    return {
+        "file_name": widget.get("fileName"),
+        "uploaded_on": parse_upload_date(widget.get("uploadedOn")),
+    }
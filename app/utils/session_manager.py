@@ -1,38 +1,49 @@
 import json
 import os
 from pathlib import Path
+from urllib.parse import urlparse
 from selenium.webdriver.remote.webdriver import WebDriver
+from config.settings import Settings
 from core.logger import logger
+from core.wait_timings import wait_timings
 
 # Cookie file path
 COOKIE_FILE = Path(__file__).parent.parent / "cookies.json"
 
 
-def save_cookies(driver: WebDriver):
+def _cookie_path(cookie_file=None) -> Path:
+    """Per-account cookie file, or the default single-account one."""
+    return Path(cookie_file) if cookie_file else COOKIE_FILE
+
+
+def save_cookies(driver: WebDriver, cookie_file=None):
     """Save browser cookies to a JSON file."""
+    cookie_path = _cookie_path(cookie_file)
     try:
         cookies = driver.get_cookies()
-        with open(COOKIE_FILE, 'w') as f:
+        cookie_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cookie_path, 'w') as f:
             json.dump(cookies, f, indent=2)
-        logger.info(f"✓ Saved {len(cookies)} cookies to {COOKIE_FILE}")
+        logger.info(f"✓ Saved {len(cookies)} cookies to {cookie_path}")
         return True
     except Exception as e:
         logger.error(f"Failed to save cookies: {e}")
         return False
 
 
-def load_cookies(driver: WebDriver) -> bool:
+def load_cookies(driver: WebDriver, cookie_file=None) -> bool:
     """Load cookies from JSON file and add them to the browser."""
-    if not COOKIE_FILE.exists():
+    cookie_path = _cookie_path(cookie_file)
+    if not cookie_path.exists():
         logger.info("No saved cookies found")
         return False
     
     try:
-        with open(COOKIE_FILE, 'r') as f:
+        with open(cookie_path, 'r') as f:
             cookies = json.load(f)
         
         # Navigate to the domain first (required for adding cookies)
-        driver.get("https://www.naukri.com")
+        driver.get(Settings.BASE_URL)
         
         for cookie in cookies:
             try:
@@ -45,18 +56,19 @@ def load_cookies(driver: WebDriver) -> bool:
                 logger.warning(f"Could not add cookie {cookie.get('name', 'unknown')}: {e}")
                 continue
         
-        logger.info(f"✓ Loaded {len(cookies)} cookies from {COOKIE_FILE}")
+        logger.info(f"✓ Loaded {len(cookies)} cookies from {cookie_path}")
         return True
     except Exception as e:
         logger.error(f"Failed to load cookies: {e}")
         return False
 
 
-def clear_cookies():
+def clear_cookies(cookie_file=None):
     """Delete the saved cookies file."""
+    cookie_path = _cookie_path(cookie_file)
     try:
-        if COOKIE_FILE.exists():
-            COOKIE_FILE.unlink()
+        if cookie_path.exists():
+            cookie_path.unlink()
             logger.info("✓ Cleared saved cookies")
             return True
     except Exception as e:
@@ -68,16 +80,17 @@ def is_logged_in(driver: WebDriver) -> bool:
     """Check if user is logged in by checking for logged-in indicators."""
     try:
         # Refresh the page to ensure we're using the loaded cookies
-        driver.get("https://www.naukri.com")
+        driver.get(Settings.BASE_URL)
         
         # Wait a bit for page to load
         from selenium.webdriver.support.ui import WebDriverWait
         from selenium.webdriver.support import expected_conditions as EC
         from selenium.webdriver.common.by import By
         
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
+        with wait_timings.adaptive("session.home_body", 10) as wait:
+            WebDriverWait(driver, wait.timeout).until(
+                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            )
         
         # Check for indicators that user is logged in
         # Common indicators: profile link, logout button, user menu, etc.
@@ -90,11 +103,12 @@ def is_logged_in(driver: WebDriver) -> bool:
         ]
         
         from selenium.common.exceptions import TimeoutException
-        for indicator in logged_in_indicators:
+        for index, indicator in enumerate(logged_in_indicators):
             try:
-                element = WebDriverWait(driver, 3).until(
-                    EC.presence_of_element_located((By.XPATH, indicator))
-                )
+                with wait_timings.adaptive(f"session.indicator.{index}", 3, optional=True) as wait:
+                    element = WebDriverWait(driver, wait.timeout).until(
+                        EC.presence_of_element_located((By.XPATH, indicator))
+                    )
                 if element:
                     logger.info("✓ User appears to be logged in (found logged-in indicator)")
                     return True
@@ -103,7 +117,8 @@ def is_logged_in(driver: WebDriver) -> bool:
         
         # Alternative: Check if we're redirected away from login page
         current_url = driver.current_url.lower()
-        if "login" not in current_url and "naukri.com" in current_url:
+        site_host = urlparse(Settings.BASE_URL).hostname.removeprefix("www.")
+        if "login" not in current_url and site_host in current_url:
             logger.info("✓ User appears to be logged in (not on login page)")
             return True
         
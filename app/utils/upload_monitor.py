@@ -0,0 +1,80 @@
+import re
+import time
+
+from config.settings import Settings
+from core.logger import logger
+from core.metrics import metrics
+
+
+def is_network_capture_enabled(driver) -> bool:
+    """True when the driver is a selenium-wire driver that captures requests."""
+    return Settings.NETWORK_UPLOAD_CONFIRM and hasattr(driver, "backend")
+
+
+def clear_captured_requests(driver):
+    """Drop previously captured requests so only the upload is inspected."""
+    try:
+        del driver.requests
+    except Exception as e:
+        logger.warning(f"Could not clear captured requests: {e}")
+
+
+def _carries_file(request, min_bytes):
+    """Whether a request matching the URL pattern is the file upload itself."""
+    if min_bytes:
+        return len(request.body or b"") >= min_bytes
+    return "multipart/form-data" in (request.headers.get("Content-Type") or "").lower()
+
+
+def wait_for_upload_response(driver, timeout=None, min_bytes=0):
+    """
+    Wait for the browser's resume upload request and its server response.
+
+    Captured requests live in the local selenium-wire proxy, so polling them
+    costs no Grid round trips. The URL pattern also matches widget and
+    tracking calls, so only a request whose body is at least min_bytes (the
+    resume's size), or without min_bytes a multipart one, counts as the
+    upload. Returns a dict describing the response, or None if no upload
+    request completed within the timeout.
+    """
+    timeout = timeout if timeout is not None else Settings.UPLOAD_CONFIRM_TIMEOUT
+    pattern = re.compile(Settings.UPLOAD_REQUEST_PATTERN, re.IGNORECASE)
+
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        for request in driver.requests:
+            if request.method not in ("POST", "PUT"):
+                continue
+            if not pattern.search(request.url):
+                continue
+            if not _carries_file(request, min_bytes):
+                continue
+            if request.response is None:
+                continue
+
+            response = request.response
+            latency_ms = round((response.date - request.date).total_seconds() * 1000, 1)
+            result = {
+                "url": request.url,
+                "status": response.status_code,
+                "ok": 200 <= response.status_code < 300,
+                "latency_ms": latency_ms,
+                "request_bytes": len(request.body or b""),
+                "response_bytes": len(response.body or b""),
+            }
+
+            metrics.record("upload_response_status", result["status"])
+            metrics.record("upload_response_latency_ms", result["latency_ms"])
+            metrics.record("upload_request_bytes", result["request_bytes"])
+            metrics.record("upload_response_bytes", result["response_bytes"])
+
+            logger.info(
+                f"Upload response {result['status']} from {request.url} "
+                f"in {latency_ms} ms ({result['request_bytes']} bytes sent)"
+            )
+            return result
+
+        time.sleep(0.25)
+
+    logger.warning(f"No upload response matching {Settings.UPLOAD_REQUEST_PATTERN} within {timeout}s")
+    return None
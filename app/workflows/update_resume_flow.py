@@ -5,142 +5,82 @@ from selenium.common.exceptions import TimeoutException
 from selenium.common.exceptions import NoSuchElementException
 
 from config.settings import Settings
+from config.accounts import Account
 from utils.google_drive import download_resume
+from utils.pdf_optimizer import optimize_resume
+from utils.file_hash import file_sha256
+from utils.file_transfer import send_file
+from utils.dom_query import deep_find, switch_to_frame_path
+from utils.cache_stats import record_cache_stats
+from utils.form_actions import fill_and_submit, perform
+from utils.resume_widget import read_resume_widget, normalize_file_name
 from utils.session_manager import load_cookies, save_cookies, is_logged_in
+from utils.upload_monitor import (
+    is_network_capture_enabled,
+    clear_captured_requests,
+    wait_for_upload_response,
+)
+from core.checkpoint import Checkpoint, NonRetryableError, RetryPolicy, run_with_retry
 from core.logger import logger
+from core.metrics import metrics
+from core.wait_timings import wait_timings
 
 import os
 import time
+from datetime import date
+
+
+class UploadRejected(NonRetryableError):
+    """The server answered the upload request with an error; only a new submission can help."""
 
 
 # ------------------------------------------------------------
 # SMART WAIT HELPERS
 # ------------------------------------------------------------
 
-def wait_for(driver, by, value, timeout=12):
-    return WebDriverWait(driver, timeout).until(
-        EC.presence_of_element_located((by, value))
-    )
-
-def wait_clickable(driver, by, value, timeout=12):
-    return WebDriverWait(driver, timeout).until(
-        EC.element_to_be_clickable((by, value))
-    )
-
-
-# Search for file input across main document and inside iframes
-def find_file_input(driver, locators, per_locator_timeout=5):
-    # Try the provided locators in the main document first
-    for by, locator in locators:
-        try:
-            logger.info(f"Trying file input locator: {locator}")
-            elem = WebDriverWait(driver, per_locator_timeout).until(
-                EC.presence_of_element_located((by, locator))
-            )
-            if elem:
-                return elem, None
-        except TimeoutException:
-            continue
+# A named wait's timeout is learned from how long it took in previous runs,
+# with the given timeout as the ceiling (see core/wait_timings.py)
 
-    # Try a generic querySelector in main document
-    try:
-        elem = driver.execute_script("return document.querySelector('input[type=file]');")
-        if elem:
-            logger.info("✓ Found file input via querySelector in main document")
-            return elem, None
-    except Exception:
-        pass
+def wait_for(driver, by, value, timeout=12, name=None, optional=False):
+    with wait_timings.adaptive(name, timeout, optional=optional) as wait:
+        return WebDriverWait(driver, wait.timeout).until(
+            EC.presence_of_element_located((by, value))
+        )
 
-    # Search inside iframes
-    iframes = driver.find_elements(By.TAG_NAME, 'iframe')
-    for idx, iframe in enumerate(iframes):
-        try:
-            logger.info(f"Searching for file input inside iframe[{idx}]")
-            driver.switch_to.frame(iframe)
+def wait_clickable(driver, by, value, timeout=12, name=None, optional=False):
+    with wait_timings.adaptive(name, timeout, optional=optional) as wait:
+        return WebDriverWait(driver, wait.timeout).until(
+            EC.element_to_be_clickable((by, value))
+        )
 
-            for by, locator in locators:
-                try:
-                    logger.info(f"Trying file input locator in iframe[{idx}]: {locator}")
-                    elem = WebDriverWait(driver, per_locator_timeout).until(
-                        EC.presence_of_element_located((by, locator))
-                    )
-                    if elem:
-                        return elem, iframe
-                except TimeoutException:
-                    continue
+def find_named(driver, name, locators, timeout, clickable=False, optional=False):
+    """deep_find with an adaptive timeout. Returns (element, frame_path) or (None, None)."""
+    with wait_timings.adaptive(name, timeout, optional=optional) as wait:
+        elem, frame_path = deep_find(driver, locators, timeout=wait.timeout, clickable=clickable)
+        wait.ok = elem is not None
+    return elem, frame_path
 
-            try:
-                elem = driver.execute_script("return document.querySelector('input[type=file]');")
-                if elem:
-                    logger.info(f"✓ Found file input via querySelector in iframe[{idx}]")
-                    return elem, iframe
-            except Exception:
-                pass
 
-        except Exception as e:
-            logger.warning(f"Could not inspect iframe[{idx}]: {e}")
-        finally:
-            driver.switch_to.default_content()
-
-    return None, None
-
-
-# Fallback: deep JS search to find input[type=file] across document, shadow roots and iframes
-def find_file_input_js(driver):
-    js = r"""
-    function findInNode(node){
-        if(!node) return null;
-        try{
-            // Direct match
-            var inputs = node.querySelectorAll('input[type=file]');
-            if(inputs && inputs.length) return inputs[0];
-        }catch(e){}
-
-        // shadow root search
-        try{
-            if(node.shadowRoot){
-                var s = node.shadowRoot.querySelectorAll('input[type=file]');
-                if(s && s.length) return s[0];
-            }
-        }catch(e){}
-
-        // traverse children
-        try{
-            var children = node.children || [];
-            for(var i=0;i<children.length;i++){
-                var found = findInNode(children[i]);
-                if(found) return found;
-            }
-        }catch(e){}
-
-        return null;
-    }
-
-    // Try main document
-    var found = findInNode(document);
-    if(found) return found;
-
-    // Try iframes (same-origin only)
-    var iframes = document.getElementsByTagName('iframe');
-    for(var i=0;i<iframes.length;i++){
-        try{
-            var doc = iframes[i].contentDocument || iframes[i].contentWindow.document;
-            var f = findInNode(doc);
-            if(f) return f;
-        }catch(e){
-            // cross-origin or access denied
-            continue;
-        }
-    }
-
-    return null;
+# Search for file input across main document, shadow roots and iframes
+def find_file_input(driver, locators, per_locator_timeout=5, name="upload.file_input"):
     """
+    Locate the resume file input with the deep query engine.
 
-    try:
-        elem = driver.execute_script(js)
-        return elem
-    except Exception:
-        return None
+    All locators are tried in priority order in one pass over the document,
+    open shadow roots and same-origin iframes, followed by a generic
+    input[type=file] match. Returns (element, frame_path); frame_path is
+    empty for the top document.
+    """
+    logger.info(f"Searching for file input with {len(locators)} locator(s) (document, shadow DOM, iframes)")
+    elem, frame_path = find_named(
+        driver,
+        name,
+        list(locators) + [(By.CSS_SELECTOR, "input[type=file]")],
+        timeout=per_locator_timeout,
+    )
+    if elem and frame_path:
+        logger.info(f"✓ Found file input inside iframe path {frame_path}")
+    return elem, frame_path
 
 # ------------------------------------------------------------
 # CLOSE CHATBOT IF VISIBLE
@@ -159,18 +99,27 @@ def close_chatbot_if_visible(driver):
         "//button[@aria-label='Close']",
     ]
 
-    for xpath in possible_close_buttons:
-        try:
-            elem = WebDriverWait(driver, 2).until(
-                EC.element_to_be_clickable((By.XPATH, xpath))
-            )
-            elem.click()
-            logger.info("Chatbot closed.")
-            return True
-        except:
-            continue
+    # One deep query for all candidates instead of a 2 s wait per XPath
+    elem, frame_path = find_named(
+        driver,
+        "chatbot.close_button",
+        [(By.XPATH, xpath) for xpath in possible_close_buttons],
+        timeout=2,
+        clickable=True,
+        optional=True,
+    )
+    if not elem:
+        return False
 
-    return False
+    try:
+        switch_to_frame_path(driver, frame_path)
+        elem.click()
+        logger.info("Chatbot closed.")
+        return True
+    except Exception:
+        return False
+    finally:
+        driver.switch_to.default_content()
 
 
 # ------------------------------------------------------------
@@ -186,9 +135,10 @@ def click_login_button(driver):
         (By.XPATH, "//a[contains(text(), 'Login')]"),
     ]
 
-    for by, locator in login_locators:
+    for index, (by, locator) in enumerate(login_locators):
         try:
-            btn = wait_clickable(driver, by, locator, timeout=8)
+            # Fallback locators: most of them never match the current page
+            btn = wait_clickable(driver, by, locator, timeout=8, name=f"login.layer_button.{index}", optional=True)
             driver.execute_script("arguments[0].scrollIntoView(true);", btn)
             btn.click()
             logger.info("Clicked Login button.")
@@ -203,14 +153,17 @@ def click_login_button(driver):
 # PERFORM LOGIN
 # ------------------------------------------------------------
 
-def perform_login(driver):
-    """Perform login with email and password."""
+def perform_login(driver, account=None):
+    """Perform login with email and password (the .env account by default)."""
+    account = account or Account.from_settings()
+
     # Navigate directly to login page
     logger.info(f"Navigating to login page: {Settings.LOGIN_URL}")
     driver.get(Settings.LOGIN_URL)
     
     # Wait for page to load
-    wait_for(driver, By.TAG_NAME, "body", timeout=15)
+    wait_for(driver, By.TAG_NAME, "body", timeout=15, name="login.page_body")
+    record_cache_stats(driver, "login page")
     close_chatbot_if_visible(driver)
 
     # Try multiple selectors for email input
@@ -223,24 +176,12 @@ def perform_login(driver):
         (By.XPATH, "//input[contains(@class, 'email') or contains(@class, 'username')]"),
     ]
     
-    email_input = None
-    for by, locator in email_locators:
-        try:
-            logger.info(f"Trying email locator: {locator}")
-            email_input = wait_for(driver, by, locator, timeout=5)
-            if email_input:
-                logger.info(f"✓ Found email input with: {locator}")
-                break
-        except TimeoutException:
-            continue
+    # The login form lives in the top document, so frame paths are not followed here
+    email_input, _ = find_named(driver, "login.email_input", email_locators, timeout=5)
     
     if not email_input:
         raise Exception("❌ Could not find email input field on login page")
     
-    email_input.clear()
-    email_input.send_keys(Settings.NAUKRI_EMAIL)
-    logger.info("✓ Email entered")
-
     # Try multiple selectors for password input
     password_locators = [
         (By.XPATH, "//input[@type='password' and contains(@placeholder, 'password')]"),
@@ -250,23 +191,10 @@ def perform_login(driver):
         (By.XPATH, "//input[@id='passwordField']"),
     ]
     
-    password_input = None
-    for by, locator in password_locators:
-        try:
-            logger.info(f"Trying password locator: {locator}")
-            password_input = wait_for(driver, by, locator, timeout=5)
-            if password_input:
-                logger.info(f"✓ Found password input with: {locator}")
-                break
-        except TimeoutException:
-            continue
+    password_input, _ = find_named(driver, "login.password_input", password_locators, timeout=5)
     
     if not password_input:
         raise Exception("❌ Could not find password input field on login page")
-    
-    password_input.clear()
-    password_input.send_keys(Settings.NAUKRI_PASSWORD)
-    logger.info("✓ Password entered")
 
     # Try multiple selectors for login button
     login_button_locators = [
@@ -276,29 +204,32 @@ def perform_login(driver):
         (By.XPATH, "//button[contains(@class, 'login')]"),
         (By.XPATH, "//button[contains(@class, 'submit')]"),
     ]
-    
-    login_submit = None
-    for by, locator in login_button_locators:
-        try:
-            logger.info(f"Trying login button locator: {locator}")
-            login_submit = wait_clickable(driver, by, locator, timeout=5)
-            if login_submit:
-                logger.info(f"✓ Found login button with: {locator}")
-                break
-        except TimeoutException:
-            continue
-    
-    if not login_submit:
-        raise Exception("❌ Could not find login button on login page")
-    
-    login_submit.click()
-    logger.info("✓ Login button clicked")
+
+    # The button may stay disabled until the fields are filled; the form
+    # itself is submitted in that case
+    login_submit, _ = deep_find(driver, login_button_locators, clickable=True)
+
+    # Fill both fields and submit in a single script call
+    submitted = fill_and_submit(
+        driver,
+        [(email_input, account.email), (password_input, account.password)],
+        submit=login_submit,
+    )
+    logger.info("✓ Email and password entered")
+
+    if not submitted:
+        login_submit, _ = find_named(driver, "login.submit_button", login_button_locators, timeout=5, clickable=True)
+        if not login_submit:
+            raise Exception("❌ Could not find login button on login page")
+        login_submit.click()
+    logger.info(f"✓ Login submitted ({submitted or 'button'})")
 
     # Wait for login to complete (check if we're redirected away from login page)
     try:
-        WebDriverWait(driver, 15).until(
-            lambda d: "login" not in d.current_url.lower() or d.current_url == Settings.NAUKRI_PROFILE_URL
-        )
+        with wait_timings.adaptive("login.redirect", 15) as wait:
+            WebDriverWait(driver, wait.timeout).until(
+                lambda d: "login" not in d.current_url.lower() or d.current_url == account.profile_url
+            )
     except TimeoutException:
         logger.warning("Still on login page after clicking login - might need manual verification")
 
@@ -306,7 +237,7 @@ def perform_login(driver):
     close_chatbot_if_visible(driver)
     
     # Save cookies after successful login
-    save_cookies(driver)
+    save_cookies(driver, account.cookie_file)
 
 
 # ------------------------------------------------------------
@@ -315,27 +246,133 @@ def perform_login(driver):
 
 class UpdateResumeFlow:
 
+    # Retry policy for each checkpointed step
+    STEP_POLICIES = {
+        "resume_ready": RetryPolicy(attempts=3, delay=5),
+        "session_valid": RetryPolicy(attempts=2, delay=5),
+        "profile_loaded": RetryPolicy(attempts=3, delay=3),
+        "resume_submitted": RetryPolicy(attempts=2, delay=3),
+        "upload_verified": RetryPolicy(attempts=3, delay=2),
+    }
+
+    # A checkpointed download older than this is fetched again, so a resume
+    # changed later in the day is not masked by an earlier run's copy
+    RESUME_REUSE_SECONDS = 3600
+
+    def __init__(self, checkpoint=None, account=None):
+        self.account = account or Account.from_settings()
+        self.checkpoint = checkpoint if checkpoint is not None else Checkpoint(self.account.checkpoint_file)
+        self.resume_path = None
+        self.network_confirm = False
+
     def run(self, driver):
 
         logger.info("🚀 Starting Naukri resume update automation")
 
+        session_id = driver.session_id
+
         # ------------------------------------------------------------
         # 1. DOWNLOAD RESUME FROM GITHUB
         # ------------------------------------------------------------
-        resume_path = download_resume()
+        resume = self._run_step(
+            "resume_ready",
+            self.prepare_resume,
+            reuse=self._resume_reusable,
+        )
+        self.resume_path = resume["path"]
+        resume_sha = resume["sha256"]
 
-        # Convert to ABSOLUTE path (critical)
-        resume_path = os.path.abspath(resume_path)
-        logger.info(f"Using resume file: {resume_path}")
+        verified = self.checkpoint.get("upload_verified")
+        if verified and verified["verified"] and verified["sha256"] == resume_sha:
+            logger.info("⏭ This resume was already uploaded and verified today - nothing to do")
+            return
 
+        # Browser-bound steps are only reusable within the same WebDriver session
+        same_session = lambda saved: saved.get("session_id") == session_id
 
         # ------------------------------------------------------------
         # 2. LOGIN (with cookie-based session management)
         # ------------------------------------------------------------
+        self._run_step("session_valid", lambda: self.ensure_session(driver), reuse=same_session)
+
+        # ------------------------------------------------------------
+        # 3. NAVIGATE TO PROFILE PAGE
+        # ------------------------------------------------------------
+        self._run_step("profile_loaded", lambda: self.load_profile(driver), reuse=same_session)
+
+        # The checkpoint does not survive fresh CI runners, so also ask the
+        # profile itself whether this resume already went up today
+        if Settings.SKIP_UPLOAD_IF_CURRENT and self.profile_shows_resume(driver):
+            metrics.record("upload_skipped", True)
+            self.checkpoint.mark("upload_verified", {"sha256": resume_sha, "verified": True, "skipped": True})
+            logger.info("⏭ Profile already shows this resume uploaded today - skipping upload")
+            return
+
+        # A rejected upload is not fixed by verifying it again; submit again instead
+        submit_policy = self.STEP_POLICIES["resume_submitted"]
+        for submission in range(1, submit_policy.attempts + 1):
+            # ------------------------------------------------------------
+            # 4. UPLOAD RESUME
+            # ------------------------------------------------------------
+            self._run_step(
+                "resume_submitted",
+                lambda: self.submit_resume(driver, resume_sha),
+                reuse=lambda saved: same_session(saved) and saved["sha256"] == resume_sha,
+                on_retry=lambda: self.load_profile(driver),
+            )
+
+            # ------------------------------------------------------------
+            # 5. VERIFY UPLOAD
+            # ------------------------------------------------------------
+            try:
+                self._run_step("upload_verified", lambda: self.verify_upload(driver, resume_sha))
+                break
+            except UploadRejected:
+                if submission == submit_policy.attempts:
+                    raise
+                logger.info(f"Submitting the resume again in {submit_policy.delay:.0f} seconds...")
+                self.checkpoint.discard("resume_submitted")
+                time.sleep(submit_policy.delay)
+                self.load_profile(driver)
+
+        logger.info("🎉 Naukri resume automation completed successfully.")
+
+    def _resume_reusable(self, saved):
+        """A downloaded resume is reused only while fresh and unchanged on disk."""
+        return (
+            time.time() - saved.get("created_at", 0) < self.RESUME_REUSE_SECONDS
+            and os.path.exists(saved["path"])
+            and file_sha256(saved["path"]) == saved["sha256"]
+        )
 
+    def _run_step(self, name, func, reuse=None, on_retry=None):
+        """Run one step with its retry policy, skipping it if a reusable checkpoint exists."""
+        saved = self.checkpoint.get(name)
+        if saved and reuse and reuse(saved):
+            logger.info(f"⏭ Skipping step '{name}' (checkpoint)")
+            return saved
+
+        logger.info(f"▶ Step '{name}'")
+        result = run_with_retry(name, func, self.STEP_POLICIES[name], on_retry=on_retry)
+        self.checkpoint.mark(name, result)
+        return result
+
+    def prepare_resume(self):
+        resume_path = download_resume(self.account.resume_url, self.account.resume_path)
+
+        if Settings.OPTIMIZE_RESUME:
+            resume_path = optimize_resume(resume_path)
+
+        # Convert to ABSOLUTE path (critical)
+        resume_path = os.path.abspath(resume_path)
+        logger.info(f"Using resume file: {resume_path}")
+
+        return {"path": resume_path, "sha256": file_sha256(resume_path), "created_at": time.time()}
+
+    def ensure_session(self, driver):
         # Try to load saved cookies first
         logger.info("Attempting to load saved session cookies...")
-        cookies_loaded = load_cookies(driver)
+        cookies_loaded = load_cookies(driver, self.account.cookie_file)
         
         if cookies_loaded:
             # Check if we're already logged in with the cookies
@@ -344,24 +381,24 @@ class UpdateResumeFlow:
                 close_chatbot_if_visible(driver)
             else:
                 logger.info("Cookies loaded but session expired. Performing fresh login...")
-                perform_login(driver)
+                perform_login(driver, self.account)
         else:
             logger.info("No saved cookies found. Performing fresh login...")
-            perform_login(driver)
+            perform_login(driver, self.account)
 
+        return {"session_id": driver.session_id}
 
-        # ------------------------------------------------------------
-        # 3. NAVIGATE TO PROFILE PAGE
-        # ------------------------------------------------------------
-        logger.info(f"Navigating to profile page: {Settings.NAUKRI_PROFILE_URL}")
-        driver.get(Settings.NAUKRI_PROFILE_URL)
+    def load_profile(self, driver):
+        logger.info(f"Navigating to profile page: {self.account.profile_url}")
+        driver.get(self.account.profile_url)
 
         # Wait for page to fully load
-        wait_for(driver, By.TAG_NAME, "body", timeout=15)
+        wait_for(driver, By.TAG_NAME, "body", timeout=15, name="profile.page_body")
         close_chatbot_if_visible(driver)
         
         # Wait a bit more for dynamic content to load
         time.sleep(3)
+        record_cache_stats(driver, "profile page")
         
         # Scroll to resume section to ensure it's in view
         try:
@@ -372,20 +409,31 @@ class UpdateResumeFlow:
         except:
             logger.warning("Could not find resume section to scroll to - continuing anyway")
 
+        return {"session_id": driver.session_id}
 
-        # ------------------------------------------------------------
-        # 4. UPLOAD RESUME
-        # ------------------------------------------------------------
+    def profile_shows_resume(self, driver):
+        """True when the profile's resume widget shows this file name uploaded today."""
+        widget = read_resume_widget(driver)
+        if not widget:
+            logger.info("Resume widget not readable - uploading")
+            return False
+
+        logger.info(f"Profile shows resume '{widget['file_name']}' uploaded on {widget['uploaded_on']}")
+        return (
+            normalize_file_name(widget["file_name"]) == normalize_file_name(os.path.basename(self.resume_path))
+            and widget["uploaded_on"] == date.today()
+        )
 
+    def submit_resume(self, driver, resume_sha):
         try:
             logger.info("Looking for resume upload input field...")
             
             # Wait for the resume section to be visible
-            wait_for(driver, By.TAG_NAME, "body", timeout=10)
+            wait_for(driver, By.TAG_NAME, "body", timeout=10, name="upload.page_body")
             
             # Try multiple strategies to find and interact with the file input
             upload_input = None
-            iframe_ctx = None
+            frame_path = []
 
             # Strategy 1: Look for attachCV by ID (most common)
             file_input_locators = [
@@ -397,8 +445,8 @@ class UpdateResumeFlow:
                 (By.XPATH, "//input[@type='file']"),
             ]
 
-            # Use iframe-aware finder helper
-            upload_input, iframe_ctx = find_file_input(driver, file_input_locators, per_locator_timeout=5)
+            # Use the deep (shadow DOM / iframe aware) finder helper
+            upload_input, frame_path = find_file_input(driver, file_input_locators, per_locator_timeout=5)
 
             if not upload_input:
                 # Strategy 2: Try clicking the "Update resume" button first to trigger file input
@@ -411,89 +459,69 @@ class UpdateResumeFlow:
                     (By.XPATH, "//*[contains(text(), 'Update resume')]") ,
                 ]
 
-                update_button = None
-                for by, locator in update_button_locators:
+                update_button, button_path = find_named(
+                    driver, "upload.update_button", update_button_locators, timeout=5, clickable=True
+                )
+                if update_button:
+                    logger.info("✓ Found update button")
+                    switch_to_frame_path(driver, button_path)
+                    # Click the button to trigger file input
                     try:
-                        update_button = wait_clickable(driver, by, locator, timeout=5)
-                        if update_button:
-                            logger.info(f"✓ Found update button with: {locator}")
-                            # Click the button to trigger file input
-                            try:
-                                update_button.click()
-                            except Exception:
-                                driver.execute_script("arguments[0].click();", update_button)
-                            logger.info("✓ Clicked update button")
-                            # Wait a bit for file input to appear
-                            time.sleep(2)
-                            break
-                    except TimeoutException:
-                        continue
+                        update_button.click()
+                    except Exception:
+                        driver.execute_script("arguments[0].click();", update_button)
+                    driver.switch_to.default_content()
+                    logger.info("✓ Clicked update button")
+                    # Wait a bit for file input to appear
+                    time.sleep(2)
 
                 # Try finding file input again after clicking the button
-                upload_input, iframe_ctx = find_file_input(driver, file_input_locators, per_locator_timeout=5)
-
-            if not upload_input:
-                # Try deep JS-based search (shadow DOM / iframes)
-                logger.info("Attempting deep JS search for file input (shadow DOM / iframes)...")
-                try:
-                    js_elem = find_file_input_js(driver)
-                    if js_elem:
-                        upload_input = js_elem
-                        iframe_ctx = None
-                        logger.info("✓ Found file input via JS fallback")
-                except Exception:
-                    pass
+                upload_input, frame_path = find_file_input(
+                    driver, file_input_locators, per_locator_timeout=5, name="upload.file_input_after_button"
+                )
 
             if not upload_input:
                 raise Exception("❌ Could not find file upload input field. Naukri UI may have changed.")
             
             # If the input was found inside an iframe, switch into that frame
             switched_to_frame = False
-            if iframe_ctx:
+            if frame_path:
                 try:
-                    driver.switch_to.frame(iframe_ctx)
+                    switch_to_frame_path(driver, frame_path)
                     switched_to_frame = True
                     logger.info("Switched into iframe context to interact with file input")
                 except Exception as e:
                     logger.warning(f"Could not switch to iframe context: {e}")
 
-            # Make sure the input is visible and interactable
+            # Make sure the input is visible and interactable: remove any
+            # display:none or visibility:hidden styles and focus it, in one call
             try:
-                # Remove any display:none or visibility:hidden styles
-                driver.execute_script("""
-                    arguments[0].style.display = 'block';
-                    arguments[0].style.visibility = 'visible';
-                    arguments[0].style.opacity = '1';
-                    arguments[0].style.position = 'static';
-                    arguments[0].style.height = 'auto';
-                    arguments[0].style.width = 'auto';
-                """, upload_input)
+                perform(driver, upload_input, "reveal", "focus")
+                time.sleep(0.5)
             except Exception as e:
-                logger.warning(f"Could not modify input styles: {e}")
+                logger.warning(f"Could not prepare file input: {e}")
 
             # Upload the file
-            logger.info(f"Uploading resume from: {resume_path}")
+            logger.info(f"Uploading resume from: {self.resume_path}")
 
-            # First, ensure the file input is ready
-            try:
-                # Trigger focus event
-                driver.execute_script("arguments[0].focus();", upload_input)
-                time.sleep(0.5)
-            except Exception:
-                pass
+            # Only the upload request should be inspected for confirmation
+            self.network_confirm = is_network_capture_enabled(driver)
+            if self.network_confirm:
+                clear_captured_requests(driver)
 
-            # Send the file path
-            upload_input.send_keys(resume_path)
+            # Send the file path (transferred to the Grid node once per session)
+            send_file(driver, upload_input, self.resume_path)
             logger.info("✓ File path sent to input field")
             
-            # Trigger change event (often required for file uploads to work)
+            # Trigger change event (often required for file uploads to work) and
+            # verify the file was actually selected, while still in the input's frame
             try:
-                driver.execute_script("""
-                    var input = arguments[0];
-                    var event = new Event('change', { bubbles: true });
-                    input.dispatchEvent(event);
-                """, upload_input)
+                file_value = perform(driver, upload_input, "change", "value").get("value")
                 logger.info("✓ Triggered change event on file input")
+                if file_value:
+                    logger.info(f"✓ File input value confirmed: {file_value}")
+                else:
+                    logger.warning("⚠ File input value is empty - file may not have been selected")
             except Exception as e:
                 logger.warning(f"Could not trigger change event: {e}")
             
@@ -508,16 +536,6 @@ class UpdateResumeFlow:
                 except Exception:
                     pass
             
-            # Verify file was actually selected
-            try:
-                file_value = upload_input.get_attribute('value')
-                if file_value:
-                    logger.info(f"✓ File input value confirmed: {file_value}")
-                else:
-                    logger.warning("⚠ File input value is empty - file may not have been selected")
-            except Exception as e:
-                logger.warning(f"Could not verify file input value: {e}")
-            
             # Check for upload progress indicators or submit buttons
             logger.info("Checking for upload progress or submit buttons...")
             
@@ -531,96 +549,120 @@ class UpdateResumeFlow:
                 (By.XPATH, "//button[@type='submit']"),
             ]
             
-            submit_button = None
-            for by, locator in submit_button_locators:
-                try:
-                    submit_button = WebDriverWait(driver, 5).until(
-                        EC.element_to_be_clickable((by, locator))
-                    )
-                    if submit_button:
-                        logger.info(f"✓ Found submit button: {locator}")
-                        submit_button.click()
-                        logger.info("✓ Clicked submit button")
-                        time.sleep(2)
-                        break
-                except TimeoutException:
-                    continue
-            
+            submit_button, submit_path = find_named(
+                driver, "upload.submit_button", submit_button_locators, timeout=5, clickable=True
+            )
+            if submit_button:
+                logger.info("✓ Found submit button")
+                switch_to_frame_path(driver, submit_path)
+                submit_button.click()
+                driver.switch_to.default_content()
+                logger.info("✓ Clicked submit button")
+                time.sleep(2)
+
+            return {"session_id": driver.session_id, "sha256": resume_sha}
+
+        except Exception as e:
+            logger.error(f"❌ Could not upload resume: {e}")
+            # Take a screenshot for debugging
+            try:
+                screenshot_path = "upload_error_screenshot.png"
+                driver.save_screenshot(screenshot_path)
+                logger.info(f"Screenshot saved to: {screenshot_path}")
+            except:
+                pass
+            raise
+
+    def verify_upload(self, driver, resume_sha):
+        try:
             # Wait for upload to complete - look for multiple success indicators
             logger.info("Waiting for upload to complete...")
             upload_success = False
-            
+
+            # Network confirmation: the server's answer to the upload request
+            # is definitive, so the DOM heuristics below are only a fallback.
+            if self.network_confirm:
+                upload_response = wait_for_upload_response(driver, min_bytes=os.path.getsize(self.resume_path))
+                if upload_response:
+                    metrics.record("upload_confirmed_by", "network")
+                    if not upload_response["ok"]:
+                        raise UploadRejected(
+                            f"❌ Upload rejected by server (HTTP {upload_response['status']})"
+                        )
+                    upload_success = True
+                else:
+                    logger.info("Falling back to page-based upload verification")
+
             # Wait up to 45 seconds for upload completion
-            for attempt in range(15):  # Check every 3 seconds for 45 seconds total
-                time.sleep(3)
+            if not upload_success:
+                for attempt in range(15):  # Check every 3 seconds for 45 seconds total
+                    time.sleep(3)
                 
-                # Check 1: Look for success messages
-                try:
-                    success_indicators = driver.find_elements(By.XPATH, 
-                        "//*[contains(text(), 'successfully') or contains(text(), 'uploaded') or contains(text(), 'updated')]"
-                    )
-                    if success_indicators:
-                        logger.info("✓ Found success message on page")
-                        upload_success = True
-                        break
-                except:
-                    pass
+                    # Check 1: Look for success messages
+                    try:
+                        success_indicators = driver.find_elements(By.XPATH, 
+                            "//*[contains(text(), 'successfully') or contains(text(), 'uploaded') or contains(text(), 'updated')]"
+                        )
+                        if success_indicators:
+                            logger.info("✓ Found success message on page")
+                            upload_success = True
+                            metrics.record("upload_confirmed_by", "page")
+                            break
+                    except:
+                        pass
                 
-                # Check 2: Look for error messages
-                try:
-                    error_indicators = driver.find_elements(By.XPATH,
-                        "//*[contains(text(), 'error') or contains(text(), 'failed') or contains(text(), 'invalid')]"
-                    )
-                    if error_indicators:
-                        error_text = error_indicators[0].text
-                        logger.warning(f"⚠ Found potential error message: {error_text}")
-                except:
-                    pass
+                    # Check 2: Look for error messages
+                    try:
+                        error_indicators = driver.find_elements(By.XPATH,
+                            "//*[contains(text(), 'error') or contains(text(), 'failed') or contains(text(), 'invalid')]"
+                        )
+                        if error_indicators:
+                            error_text = error_indicators[0].text
+                            logger.warning(f"⚠ Found potential error message: {error_text}")
+                    except:
+                        pass
                 
-                # Check 3: Look for upload progress indicators disappearing
-                try:
-                    progress_bars = driver.find_elements(By.XPATH, "//*[contains(@class, 'progress') or contains(@class, 'loading')]")
-                    if not progress_bars:
-                        # No progress bars might mean upload is done
-                        logger.info("✓ Upload progress indicators disappeared")
-                    else:
-                        logger.info(f"Upload in progress... (attempt {attempt + 1}/15)")
-                except:
-                    pass
+                    # Check 3: Look for upload progress indicators disappearing
+                    try:
+                        progress_bars = driver.find_elements(By.XPATH, "//*[contains(@class, 'progress') or contains(@class, 'loading')]")
+                        if not progress_bars:
+                            # No progress bars might mean upload is done
+                            logger.info("✓ Upload progress indicators disappeared")
+                        else:
+                            logger.info(f"Upload in progress... (attempt {attempt + 1}/15)")
+                    except:
+                        pass
                 
-                # Check 4: Verify file name appears on page (most reliable)
-                file_name = os.path.basename(resume_path)
-                try:
-                    # Look for the file name in various places
-                    file_elements = driver.find_elements(By.XPATH, 
-                        f"//*[contains(text(), '{file_name}') or contains(text(), '{file_name.replace('.pdf', '')}')]"
-                    )
-                    if file_elements:
-                        logger.info(f"✓ Verified: File name appears on page")
-                        upload_success = True
-                        break
-                except:
-                    pass
+                    # Check 4: Verify file name appears on page (most reliable)
+                    file_name = os.path.basename(self.resume_path)
+                    try:
+                        # Look for the file name in various places
+                        file_elements = driver.find_elements(By.XPATH, 
+                            f"//*[contains(text(), '{file_name}') or contains(text(), '{file_name.replace('.pdf', '')}')]"
+                        )
+                        if file_elements:
+                            logger.info(f"✓ Verified: File name appears on page")
+                            upload_success = True
+                            metrics.record("upload_confirmed_by", "page")
+                            break
+                    except:
+                        pass
                 
-                # Check 5: Page URL change or reload
-                current_url = driver.current_url
-                if "profile" in current_url.lower():
-                    logger.info("Still on profile page, upload may be processing...")
-            
-            if upload_success:
-                logger.info("✅ Resume upload verified successfully!")
-            else:
-                logger.warning("⚠ Upload completion could not be verified. Please check manually.")
-                # Take a screenshot for debugging
-                try:
-                    screenshot_path = "upload_verification_screenshot.png"
-                    driver.save_screenshot(screenshot_path)
-                    logger.info(f"Screenshot saved to: {screenshot_path}")
-                except:
-                    pass
+                    # Check 5: Page URL change or reload
+                    current_url = driver.current_url
+                    if "profile" in current_url.lower():
+                        logger.info("Still on profile page, upload may be processing...")
             
+            if not upload_success:
+                # Retryable: the page may still catch up, and an unverified
+                # upload must not be checkpointed as done
+                raise Exception("⚠ Upload completion could not be verified")
+
+            logger.info("✅ Resume upload verified successfully!")
             logger.info("✅ Resume upload process completed!")
 
+            return {"sha256": resume_sha, "verified": True}
+
         except Exception as e:
             logger.error(f"❌ Could not upload resume: {e}")
             # Take a screenshot for debugging
@@ -632,5 +674,3 @@ class UpdateResumeFlow:
                 pass
             raise
 
-
-        logger.info("🎉 Naukri resume automation completed successfully.")